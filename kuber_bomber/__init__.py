@@ -15,12 +15,32 @@ Módulos:
 - cli: Interface de linha de comando
 """
 
+import logging
+
 __version__ = "2.0.0"
 __author__ = "Reliability Testing Framework"
 
-from .core.reliability_tester import ReliabilityTester
+# Biblioteca silenciosa por padrão: mensagens de log só aparecem depois que
+# a aplicação configura o logging (os CLIs usam setup_cli_logging)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
+
 from .utils.config import get_config, update_global_config, DEFAULT_CONFIG
 
+
+def __getattr__(name: str):
+    """
+    Importa ReliabilityTester sob demanda (PEP 562).
+    
+    Evita carregar injetores, monitoramento e simulação ao importar
+    qualquer submódulo leve do pacote.
+    """
+    if name == 'ReliabilityTester':
+        from .core.reliability_tester import ReliabilityTester
+        globals()[name] = ReliabilityTester
+        return ReliabilityTester
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     'ReliabilityTester',
     'get_config', 
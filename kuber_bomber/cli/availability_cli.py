@@ -8,22 +8,125 @@ e configuração centralizada em JSON.
 """
 
 import argparse
+import functools
+import hashlib
 import sys
-import json
 import os
+import logging
+import subprocess
+import time
 from typing import List, Optional, Dict, Any
 
-# Adicionar path do kuber_bomber
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Diretórios resolvidos uma única vez na importação
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_PKG_DIR = os.path.dirname(_MODULE_DIR)
+
+# Execução direta do arquivo (sem -m): expor a raiz do projeto para que
+# "import kuber_bomber" funcione. Via "python -m" nada é alterado.
+if __name__ == "__main__" and not __package__:
+    sys.path.append(os.path.dirname(_PKG_DIR))
 
-from kuber_bomber.simulation.availability_simulator import AvailabilitySimulator
 from kuber_bomber.core.config_simples import ConfigSimples, ConfigPresets
-from kuber_bomber.utils.infrastructure_discovery import InfrastructureDiscovery
+from kuber_bomber.utils.json_utils import loads_json, write_json_atomic
+from kuber_bomber.utils.logging_config import setup_cli_logging
+
+# Nome fixo: com "python -m" o __name__ seria "__main__"
+logger = logging.getLogger("kuber_bomber.cli.availability_cli")
+
+# arquivo aws_config.json na pasta 'configs' um nível acima deste script
+AWS_CONFIG_PATH = os.path.join(_PKG_DIR, "configs", "aws_config.json")
+
+# Configuração padrão, relativa ao diretório de execução (raiz do projeto)
+DEFAULT_CONFIG_FILE = os.path.join(os.getcwd(), "kuber_bomber", "configs", "config_simples_used.json")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_aws_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Carrega aws_config.json uma única vez por versão do arquivo.
+    
+    O mtime entra na chave do cache para que edições no arquivo
+    sejam relidas na próxima chamada.
+    """
+    return ConfigSimples.load_aws_config(path)
+
+
+# Respostas aceitas como confirmação no prompt (s/N)
+_YES = frozenset({'s', 'sim', 'y', 'yes'})
+
+# Cache em disco da descoberta (como o cache de discovery do kubectl)
+DISCOVERY_CACHE_TTL = 600  # 10 minutos
+# Validade padrão da análise MTTR em cache (sobrescrita por KUBER_BOMBER_MTTR_TTL)
+MTTR_CACHE_TTL = 86400  # 24 horas
+
+
+def _local_cluster_id() -> Optional[str]:
+    """
+    Identifica o cluster local: kubeconfig, contexto atual e URL do API server.
+    
+    Returns:
+        Identificador ou None se o kubectl não conseguir informar o contexto
+        (nesse caso o cache não é usado)
+    """
+    kubeconfig = os.environ.get('KUBECONFIG') or os.path.join(os.path.expanduser('~'), '.kube', 'config')
+    try:
+        result = subprocess.run(
+            ['kubectl', 'config', 'view', '--minify',
+             '-o', 'jsonpath={.current-context}|{.clusters[0].cluster.server}'],
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0 or not result.stdout.strip('|'):
+        return None
+    return f"local|{kubeconfig}|{result.stdout}"
+
+
+def _discovery_cache_path(cluster_id: str, iterations: int) -> str:
+    """
+    Caminho do cache de descoberta para um cluster/parâmetros.
+    
+    cluster_id deve distinguir clusters diferentes (contexto do kubectl no
+    modo local; arquivo/mtime do aws_config e host no modo AWS).
+    O diretório pode ser trocado via KUBER_BOMBER_DISCOVERY_CACHE_DIR.
+    """
+    cache_dir = os.environ.get('KUBER_BOMBER_DISCOVERY_CACHE_DIR') or os.path.join(
+        os.path.expanduser('~'), '.cache', 'kuber_bomber', 'discovery')
+    key = f"{cluster_id}|{iterations}"
+    return os.path.join(cache_dir, hashlib.sha256(key.encode('utf-8')).hexdigest() + '.json')
+
+
+def _load_cached_discovery(path: str, ttl: int) -> Optional[Dict[str, Any]]:
+    """Retorna a configuração em cache se ainda estiver dentro do TTL."""
+    if ttl <= 0:
+        return None
+    try:
+        with open(path, 'rb') as f:
+            if time.time() - os.fstat(f.fileno()).st_mtime >= ttl:
+                return None
+            raw = f.read()
+        return loads_json(raw)
+    except (OSError, ValueError):
+        # Ausente, ilegível ou corrompido: refazer a descoberta
+        return None
+
+
+def _save_cached_discovery(path: str, config: Dict[str, Any]):
+    """Grava a configuração descoberta no cache (falhas apenas avisam)."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_json_atomic(path, config)
+    except OSError as e:
+        logger.warning("⚠️ Não foi possível gravar cache de descoberta: %s", e)
 
 
 def generate_config_with_discovery(use_aws: bool = False, 
                                  iterations: int = 5, 
-                                 run_mttr_analysis: bool = False) -> str:
+                                 run_mttr_analysis: bool = False,
+                                 assume_yes: bool = False,
+                                 mttr_parallelism: int = 1,
+                                 discovery_cache_ttl: int = DISCOVERY_CACHE_TTL,
+                                 mttr_cache_ttl: Optional[int] = None) -> str:
     """
     Gera configuração via descoberta automática da infraestrutura.
     
@@ -31,53 +134,108 @@ def generate_config_with_discovery(use_aws: bool = False,
         use_aws: Se deve usar ambiente AWS
         iterations: Número de iterações
         run_mttr_analysis: Se deve executar análise MTTR breve
+        assume_yes: Confirma a análise MTTR sem perguntar (execução não interativa)
+        mttr_parallelism: Componentes testados simultaneamente na análise MTTR
+            (experimental; valores > 1 distorcem o MTTR medido)
+        discovery_cache_ttl: Validade em segundos da descoberta em cache (0 desativa)
+        mttr_cache_ttl: Validade em segundos da análise MTTR em cache (0 desativa;
+            padrão: KUBER_BOMBER_MTTR_TTL ou 24h)
         
     Returns:
         Caminho do arquivo de configuração gerado
     """
-    print("🔍 === DESCOBERTA AUTOMÁTICA DA INFRAESTRUTURA ===")
-    print()
+    logger.info("🔍 === DESCOBERTA AUTOMÁTICA DA INFRAESTRUTURA ===")
+    logger.info("")
     
     # Carregar configuração AWS se necessário
     aws_config = None
     if use_aws:
-        # arquivo aws_config.json na pasta 'configs' um nível acima deste script
-        path_aws_config = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "configs",
-            "aws_config.json"
-        )
+        path_aws_config = AWS_CONFIG_PATH
+        # Um único stat serve de teste de existência e de chave do cache
+        try:
+            mtime_ns = os.stat(path_aws_config).st_mtime_ns
+        except FileNotFoundError:
+            logger.error("❌ Configuração AWS não encontrada em %s", path_aws_config)
+            return ""
         
-        aws_config_data = ConfigSimples.load_aws_config(path_aws_config)
+        aws_config_data = _load_aws_config_cached(path_aws_config, mtime_ns)
         if aws_config_data:
             aws_config = {
                 'ssh_host': aws_config_data.get('ssh_host'),
                 'ssh_key': aws_config_data.get('ssh_key'),
                 'ssh_user': aws_config_data.get('ssh_user')
             }
-            print(f"☁️ Modo AWS ativado: {aws_config['ssh_user']}@{aws_config['ssh_host']}")
+            logger.info("☁️ Modo AWS ativado: %s@%s", aws_config['ssh_user'], aws_config['ssh_host'])
         else:
-            print(f"❌ Configuração AWS não encontrada em {path_aws_config}")
+            logger.error("❌ Configuração AWS não encontrada em %s", path_aws_config)
             return ""
     
-    # Criar discovery
-    discovery = InfrastructureDiscovery(use_aws=use_aws, aws_config=aws_config)
+    if mttr_cache_ttl is None:
+        mttr_cache_ttl = int(os.environ.get('KUBER_BOMBER_MTTR_TTL', MTTR_CACHE_TTL))
     
-    # Gerar configuração básica
-    print("📋 Gerando configuração com MTTF padrão...")
-    config, filepath = discovery.discover_and_generate_config(iterations=iterations)
+    # O cache é por cluster: no modo AWS o aws_config (caminho, mtime e host),
+    # no modo local o kubeconfig e o contexto atual do kubectl
+    if use_aws:
+        cluster_id = f"aws|{path_aws_config}|{mtime_ns}|{aws_config['ssh_host']}"
+    elif discovery_cache_ttl > 0 or (run_mttr_analysis and mttr_cache_ttl > 0):
+        cluster_id = _local_cluster_id()
+        if cluster_id is None:
+            logger.info("ℹ️ Contexto do kubectl não identificado; cache de descoberta desativado")
+            discovery_cache_ttl = mttr_cache_ttl = 0
+    else:
+        cluster_id = None
+    cache_path = _discovery_cache_path(cluster_id or 'local', iterations)
+    mttr_cache_path = cache_path[:-len('.json')] + '.mttr.json'
     
-    # Executar análise MTTR se solicitado
+    # Análise MTTR recente do mesmo cluster dispensa a descoberta e os testes.
+    # O arquivo .mttr.json guarda {'mttr_complete': True, 'config': {...}}: a
+    # marca fica só no cache, nunca no config entregue ao usuário
+    cached_mttr = None
     if run_mttr_analysis:
-        print()
-        print("🧪 === ANÁLISE MTTR COMPLETA (2 iterações por componente) ===")
-        print("⚠️ Isso executará testes de confiabilidade em TODOS os componentes...")
-        print("⏰ Tempo estimado: 10-20 minutos dependendo do cluster")
-        print("📊 Cada componente será testado 2 vezes para obter média confiável")
+        entry = _load_cached_discovery(mttr_cache_path, mttr_cache_ttl)
+        if entry is not None and entry.get('mttr_complete') and type(entry.get('config')) is dict:
+            cached_mttr = entry['config']
+    
+    config = cached_mttr or _load_cached_discovery(cache_path, discovery_cache_ttl)
+    if config is not None:
+        # Resultado recente do mesmo cluster: só regravar o arquivo de saída.
+        # Sempre visível (mesmo com --quiet): o config alimenta a injeção de falhas
+        if cached_mttr is not None:
+            print(f"♻️ Usando cache da análise MTTR: {mttr_cache_path}")
+        else:
+            print(f"♻️ Usando cache da descoberta: {cache_path}")
+        print("   (--no-cache força nova descoberta e análise)")
+        filepath = DEFAULT_CONFIG_FILE
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        write_json_atomic(filepath, config)
+    else:
+        # Criar discovery
+        from kuber_bomber.utils.infrastructure_discovery import InfrastructureDiscovery
+        
+        discovery = InfrastructureDiscovery(use_aws=use_aws, aws_config=aws_config)
+        
+        # Gerar configuração básica
+        logger.info("📋 Gerando configuração com MTTF padrão...")
+        config, filepath = discovery.discover_and_generate_config(iterations=iterations)
+        if discovery_cache_ttl > 0 and cluster_id is not None:
+            _save_cached_discovery(cache_path, config)
+    
+    # Executar análise MTTR se solicitado (e não reaproveitada do cache)
+    if run_mttr_analysis and cached_mttr is None:
+        logger.info(
+            "\n"
+            "🧪 === ANÁLISE MTTR COMPLETA (2 iterações por componente) ===\n"
+            "⚠️ Isso executará testes de confiabilidade em TODOS os componentes...\n"
+            "⏰ Tempo estimado: 10-20 minutos dependendo do cluster\n"
+            "📊 Cada componente será testado 2 vezes para obter média confiável"
+        )
         
-        confirm = input("Continuar com análise MTTR completa? (s/N): ").lower().strip()
-        if confirm in ['s', 'sim', 'y', 'yes']:
-            print("🚀 Executando análise MTTR completa...")
+        if assume_yes:
+            confirm = 's'
+        else:
+            confirm = input("Continuar com análise MTTR completa? (s/N): ").lower().strip()
+        if confirm in _YES:
+            logger.info("🚀 Executando análise MTTR completa...")
             
             try:
                 from kuber_bomber.utils.mttr_analyzer import MTTRAnalyzer
@@ -85,26 +243,29 @@ def generate_config_with_discovery(use_aws: bool = False,
                 analyzer = MTTRAnalyzer(
                     use_aws=use_aws,
                     aws_config=aws_config,
-                    iterations=2  # Reduzido para 2 para ser mais rápido
+                    iterations=2,  # Reduzido para 2 para ser mais rápido
+                    parallelism=mttr_parallelism
                 )
                 
                 # Executar análise e atualizar config
                 config = analyzer.run_complete_analysis(config)
                 
-                # Salvar config atualizado
-                with open(filepath, 'w') as f:
-                    json.dump(config, f, indent=2)
+                # Salvar config atualizado; durável por ser o resultado de
+                # minutos de testes no cluster
+                write_json_atomic(filepath, config, durable=True)
+                if cluster_id is not None:
+                    _save_cached_discovery(mttr_cache_path, {'mttr_complete': True, 'config': config})
                 
-                print("✅ Análise MTTR completa! Config atualizado com tempos reais.")
+                logger.info("✅ Análise MTTR completa! Config atualizado com tempos reais.")
                 
             except Exception as e:
-                print(f"❌ Erro na análise MTTR: {e}")
-                print("⚠️ Usando valores MTTR padrão")
+                logger.error("❌ Erro na análise MTTR: %s", e)
+                logger.warning("⚠️ Usando valores MTTR padrão")
         else:
-            print("⏭️ Pulando análise MTTR - usando valores padrão")
+            logger.info("⏭️ Pulando análise MTTR - usando valores padrão")
     
-    print()
-    print(f"✅ Configuração gerada em: {filepath}")
+    logger.info("")
+    logger.info("✅ Configuração gerada em: %s", filepath)
     return filepath
 
 
@@ -118,56 +279,62 @@ def load_or_generate_config(args) -> ConfigSimples:
     Returns:
         Configuração carregada
     """
-    config_file = os.getcwd() + "/kuber_bomber/configs/config_simples_used.json"
+    config_file = DEFAULT_CONFIG_FILE
     
-    print(f"📁 Arquivo de configuração padrão: {config_file}")
+    logger.info("📁 Arquivo de configuração padrão: %s", config_file)
     # Se forçar geração de nova configuração
     if args.get_config or args.get_config_all:
-        print("🏗️ Gerando nova configuração...")
+        logger.info("🏗️ Gerando nova configuração...")
         
         # Determinar parâmetros
-        iterations = getattr(args, 'iterations', 5)
-        use_aws = getattr(args, 'force_aws', False)
-        run_mttr = args.get_config_all if hasattr(args, 'get_config_all') else False
+        iterations = args.iterations
+        use_aws = args.force_aws
+        run_mttr = args.get_config_all
         
         # Gerar configuração
         config_file = generate_config_with_discovery(
             use_aws=use_aws,
             iterations=iterations,
-            run_mttr_analysis=run_mttr
+            run_mttr_analysis=run_mttr,
+            assume_yes=args.yes,
+            mttr_parallelism=args.mttr_parallelism,
+            discovery_cache_ttl=0 if args.no_cache else args.discovery_cache_ttl,
+            mttr_cache_ttl=0 if args.no_cache else None
         )
         
         if not config_file:
-            print("❌ Falha ao gerar configuração")
+            logger.error("❌ Falha ao gerar configuração")
             sys.exit(1)
     
-    # Carregar configuração
-    if os.path.exists(config_file):
-        print(f"📂 Carregando configuração de: {config_file}")
-        config = ConfigSimples.load_from_json(config_file)
+    # Carregar configuração (abrir direto, sem os.path.exists, evita um stat extra)
+    try:
+        config_fh = open(config_file, 'rb')
+    except FileNotFoundError:
+        config_fh = None
+    
+    if config_fh is not None:
+        logger.info("📂 Carregando configuração de: %s", config_file)
+        with config_fh:
+            config = ConfigSimples.load_from_bytes(config_fh.read())
         
         # Configurar AWS se necessário
-        if getattr(args, 'force_aws', False):
+        if args.force_aws:
             config.configure_aws()
         
         return config
     else:
-        print("⚠️ Arquivo de configuração não encontrado, gerando padrão...")
+        logger.warning("⚠️ Arquivo de configuração não encontrado, gerando padrão...")
         default_data = ConfigPresets.generate_default_config()
         config = ConfigSimples(config_data=default_data)
         
         # Salvar configuração padrão
         saved_file = config.save_config(config_file)
-        print(f"💾 Configuração padrão salva em: {saved_file}")
+        logger.info("💾 Configuração padrão salva em: %s", saved_file)
         
         return config
 
-def main():
-    """Função principal do CLI."""
-    parser = argparse.ArgumentParser(
-        description="Simulador de Disponibilidade - Nova Arquitetura com Descoberta Automática",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+
+_EPILOG = """
 Exemplos de uso:
 
 # Gerar configuração descobrindo infraestrutura local
@@ -176,6 +343,9 @@ python3 -m kuber_bomber.cli.availability_cli --get-config
 # Gerar configuração completa com análise MTTR (local)
 python3 -m kuber_bomber.cli.availability_cli --get-config-all
 
+# Mesma análise sem prompt interativo (scripts/CI)
+python3 -m kuber_bomber.cli.availability_cli --get-config-all --yes
+
 # Gerar configuração para AWS
 python3 -m kuber_bomber.cli.availability_cli --get-config --force-aws
 
@@ -188,6 +358,47 @@ python3 -m kuber_bomber.cli.availability_cli --use-config-simples --force-aws
 # Executar simulação tradicional (compatibilidade)
 python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
 """
+
+
+def _positive_int(value: str) -> int:
+    """Tipo do argparse para inteiros >= 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"inteiro esperado, recebido {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"deve ser >= 1, recebido {number}")
+    return number
+
+
+def _env_mttr_parallelism() -> int:
+    """
+    Paralelismo da análise MTTR via KUBER_BOMBER_MTTR_PARALLELISM.
+    
+    Valores inválidos geram um aviso e caem para 1 (em série).
+    """
+    raw = os.environ.get('KUBER_BOMBER_MTTR_PARALLELISM')
+    if not raw:
+        return 1
+    try:
+        return _positive_int(raw)
+    except argparse.ArgumentTypeError as e:
+        logger.warning("⚠️ KUBER_BOMBER_MTTR_PARALLELISM ignorado (%s); usando 1", e)
+        return 1
+
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Constrói o parser de argumentos do CLI.
+    
+    O parser é criado uma única vez e reutilizado em chamadas
+    subsequentes de main() no mesmo processo.
+    """
+    parser = argparse.ArgumentParser(
+        description="Simulador de Disponibilidade - Nova Arquitetura com Descoberta Automática",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=_EPILOG
     )
     
     # ===== ARGUMENTOS DE CONFIGURAÇÃO =====
@@ -207,6 +418,30 @@ python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
         action='store_true',
         help='Usar configuração JSON existente (config_simples_used.json)'
     )
+    config_group.add_argument(
+        '--yes', '-y',
+        action='store_true',
+        help='Confirmar automaticamente a análise MTTR (sem prompt interativo)'
+    )
+    config_group.add_argument(
+        '--mttr-parallelism',
+        type=_positive_int,
+        default=None,
+        help='EXPERIMENTAL: componentes testados em paralelo na análise MTTR; falhas '
+             'sobrepostas distorcem o MTTR medido (padrão: 1, em série, '
+             'ou KUBER_BOMBER_MTTR_PARALLELISM; máx: 8)'
+    )
+    config_group.add_argument(
+        '--discovery-cache-ttl',
+        type=int,
+        default=DISCOVERY_CACHE_TTL,
+        help='Segundos em que a descoberta em cache é reutilizada (padrão: 600; 0 força nova descoberta)'
+    )
+    config_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Ignorar descoberta e análise MTTR em cache (refaz tudo no cluster atual)'
+    )
     
     # ===== ARGUMENTOS DE AMBIENTE =====
     env_group = parser.add_argument_group('Ambiente')
@@ -249,50 +484,67 @@ python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
         action='store_true',
         help='Mostrar configuração carregada e sair'
     )
+    debug_group.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Exibir apenas avisos e erros'
+    )
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Função principal do CLI."""
+    args = _build_parser().parse_args()
+    setup_cli_logging(quiet=args.quiet)
+    if args.mttr_parallelism is None:
+        args.mttr_parallelism = _env_mttr_parallelism()
     
     # ===== LÓGICA PRINCIPAL =====
     
     # Modo de geração de configuração apenas
     if args.get_config or args.get_config_all:
         if args.get_config:
-            print("📋 Modo: Geração de configuração com MTTF padrão")
+            logger.info("📋 Modo: Geração de configuração com MTTF padrão")
         else:
-            print("📋 Modo: Geração de configuração completa com análise MTTR")
+            logger.info("📋 Modo: Geração de configuração completa com análise MTTR")
         
         config_file = generate_config_with_discovery(
             use_aws=args.force_aws,
             iterations=args.iterations,
-            run_mttr_analysis=args.get_config_all
+            run_mttr_analysis=args.get_config_all,
+            assume_yes=args.yes,
+            mttr_parallelism=args.mttr_parallelism,
+            discovery_cache_ttl=0 if args.no_cache else args.discovery_cache_ttl,
+            mttr_cache_ttl=0 if args.no_cache else None
         )
         
         if config_file:
-            print()
-            print("🎉 Configuração gerada com sucesso!")
-            print(f"📁 Arquivo: {config_file}")
-            print()
-            print("Para executar a simulação, use:")
+            logger.info("")
+            logger.info("🎉 Configuração gerada com sucesso!")
+            logger.info("📁 Arquivo: %s", config_file)
+            logger.info("")
+            logger.info("Para executar a simulação, use:")
             if args.force_aws:
-                print("python3 -m kuber_bomber.cli.availability_cli --use-config-simples --force-aws")
+                logger.info("python3 -m kuber_bomber.cli.availability_cli --use-config-simples --force-aws")
             else:
-                print("python3 -m kuber_bomber.cli.availability_cli --use-config-simples")
+                logger.info("python3 -m kuber_bomber.cli.availability_cli --use-config-simples")
         else:
-            print("❌ Falha ao gerar configuração")
+            logger.error("❌ Falha ao gerar configuração")
             sys.exit(1)
         
         return
     
     # Modo de execução de simulação
-    print("🎯 === SIMULADOR DE DISPONIBILIDADE KUBERNETES ===")
-    print()
+    logger.info("🎯 === SIMULADOR DE DISPONIBILIDADE KUBERNETES ===")
+    logger.info("")
     
     # Carregar configuração
     if args.use_config_simples:
-        print("📂 Modo: Usar configuração JSON existente")
+        logger.info("📂 Modo: Usar configuração JSON existente")
         config = load_or_generate_config(args)
     else:
-        print("📂 Modo: Compatibilidade (configuração tradicional)")
+        logger.info("📂 Modo: Compatibilidade (configuração tradicional)")
         # Usar configuração padrão para compatibilidade
         default_data = ConfigPresets.generate_default_config()
         default_data['duration'] = args.duration
@@ -314,9 +566,11 @@ python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
         if args.force_aws:
             try:
                 aws_config_for_simulator = config.get_aws_config()
-                print(f"🔧 Criando simulador AWS com config: {aws_config_for_simulator.get('ssh_host', 'N/A')}")
+                logger.info("🔧 Criando simulador AWS com config: %s", aws_config_for_simulator.get('ssh_host', 'N/A'))
             except Exception as e:
-                print(f"⚠️ Erro ao obter AWS config: {e}")
+                logger.warning("⚠️ Erro ao obter AWS config: %s", e)
+        
+        from kuber_bomber.simulation.availability_simulator import AvailabilitySimulator
         
         simulator = AvailabilitySimulator(aws_config=aws_config_for_simulator)
         
@@ -325,7 +579,7 @@ python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
             simulator._apply_config_simples_v2(config)
         else:
             # Fallback para método antigo se existir
-            print("⚠️ Usando método de configuração legado")
+            logger.warning("⚠️ Usando método de configuração legado")
             if hasattr(simulator, '_apply_config_simples'):
                 simulator._apply_config_simples(config)
             else:
@@ -336,59 +590,63 @@ python3 -m kuber_bomber.cli.availability_cli --duration 1000 --iterations 5
         
         # Mostrar componentes se solicitado
         if args.show_components:
-            print("🔧 === COMPONENTES CONFIGURADOS ===")
+            logger.info("🔧 === COMPONENTES CONFIGURADOS ===")
             for component in simulator.components:
                 mttf = config.get_mttf(component.name)
-                print(f"  📦 {component.name} ({component.component_type})")
-                print(f"    • MTTF: {mttf}h")
-            print()
+                logger.info("  📦 %s (%s)", component.name, component.component_type)
+                logger.info("    • MTTF: %sh", mttf)
+            logger.info("")
             return
         
         # Configurar delay entre falhas
-        if not args.use_config_simples and hasattr(args, 'delay') and args.delay != 60:
+        if not args.use_config_simples and args.delay != 60:
             # Só aplicar delay do CLI se NÃO estiver usando config simples
             simulator.real_delay_between_failures = args.delay
         elif args.use_config_simples:
             # Se usar config simples, o delay já foi aplicado no _apply_config_simples_v2
-            print(f"📄 Usando delay do config: {simulator.real_delay_between_failures}s")
+            logger.info("📄 Usando delay do config: %ss", simulator.real_delay_between_failures)
         
         # Executar simulação
-        print("📊 Configuração da simulação:")
-        print(f"  • Duração: {config.duration} horas fictícias")
-        print(f"  • Iterações: {config.iterations}")
-        
-        # Mostrar delay correto baseado na fonte
-        if args.use_config_simples:
-            print(f"  • Delay entre falhas: {simulator.real_delay_between_failures}s (do config)")
-        else:
-            print(f"  • Delay entre falhas: {getattr(args, 'delay', 60)}s (CLI)")
-        
-        print(f"  • Componentes: {len(simulator.components)}")
-        print(f"  • Aplicações: {len(config.get_applications())}")
-        
-        if config.aws_enabled:
-            print(f"  • Ambiente: AWS ({config.aws_public_ip})")
-        else:
-            print(f"  • Ambiente: Local")
-        print()
+        # Resumo montado em memória e emitido com uma única escrita
+        # (nem é formatado quando --quiet está ativo)
+        if logger.isEnabledFor(logging.INFO):
+            if args.use_config_simples:
+                delay_line = f"  • Delay entre falhas: {simulator.real_delay_between_failures}s (do config)"
+            else:
+                delay_line = f"  • Delay entre falhas: {args.delay}s (CLI)"
+            
+            if config.aws_enabled:
+                env_line = f"  • Ambiente: AWS ({config.aws_public_ip})"
+            else:
+                env_line = "  • Ambiente: Local"
+            
+            summary_lines = [
+                "📊 Configuração da simulação:",
+                f"  • Duração: {config.duration} horas fictícias",
+                f"  • Iterações: {config.iterations}",
+                delay_line,
+                f"  • Componentes: {len(simulator.components)}",
+                f"  • Aplicações: {len(config.get_applications())}",
+                env_line,
+                "",
+            ]
+            logger.info("\n".join(summary_lines))
         
-        print("🚀 Iniciando simulação...")
+        logger.info("🚀 Iniciando simulação...")
         
         simulator.run_simulation(
             duration_hours=config.duration,
             iterations=config.iterations
         )
         
-        print()
-        print("🎉 Simulação concluída com sucesso!")
+        logger.info("")
+        logger.info("🎉 Simulação concluída com sucesso!")
         
     except KeyboardInterrupt:
-        print("\n⏹️ Simulação interrompida pelo usuário")
+        logger.info("\n⏹️ Simulação interrompida pelo usuário")
         sys.exit(0)
     except Exception as e:
-        print(f"❌ Erro durante simulação: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ Erro durante simulação: %s", e)
         sys.exit(1)
 
 
@@ -31,6 +31,7 @@ from kuber_bomber.utils.config import (
     get_current_recovery_timeout, DEFAULT_CONFIG
 )
 from utils.kubectl_executor import KubectlExecutor
+from kuber_bomber.utils.logging_config import setup_cli_logging
 
 def create_parser():
     """Cria o parser de argumentos mantendo TODAS as flags originais."""
@@ -178,6 +179,7 @@ def main():
     """Função principal que processa argumentos e executa testes."""
     parser = create_parser()
     args = parser.parse_args()
+    setup_cli_logging()
     
     # Processar comandos de timeout primeiro
     if handle_timeout_commands(args):
@@ -7,11 +7,98 @@ pela descoberta de infraestrutura do cluster Kubernetes.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Union, Any, Tuple
+from collections import Counter
+import copy
+import functools
 import json
+import logging
+import mmap
 import os
 from datetime import datetime
 
+from kuber_bomber.utils.json_utils import orjson, loads_json, write_json_atomic
+
+logger = logging.getLogger(__name__)
+
+
+# Prefixos de componentes granulares já qualificados com o nome do nó
+_WORKER_COMPONENT_PREFIXES = ('wn_runtime-', 'wn_proxy-', 'wn_kubelet-')
+_CONTROL_COMPONENT_PREFIXES = ('cp_apiserver-', 'cp_manager-', 'cp_scheduler-', 'cp_etcd-')
+
+# Os dicionários vêm de json/orjson (ou de generate_default_config), sempre
+# dict/int/float concretos: `type(x) is dict` basta e evita percorrer a MRO.
+# Números continuam com isinstance para aceitar bool como a versão anterior.
+_NUMBER = (int, float)
+
+# Seções cuja presença indica mttf_config no formato aninhado
+_MTTF_NESTED_KEYS = frozenset(('pods', 'containers', 'worker_nodes', 'worker_node',
+                               'worker_components', 'control_plane'))
+
+# Modelo de ConfigPresets.generate_default_config (copiado a cada uso, nunca alterado)
+_DEFAULT_TEMPLATE: Dict[str, Any] = {
+    "experiment_config": {
+        "applications": {},
+        "worker_node": {},
+        "control_plane": {}
+    },
+    "mttf_config": {
+        "pods": {},
+        "worker_node": {},
+        "control_plane": {}
+    },
+    "mttr_config": {
+        "pods": {},
+        "worker_node": {},
+        "control_plane": {}
+    },
+    "availability_criteria": {}
+}
+
+# Seções garantidas em mttf_config/mttr_config aninhados, na ordem de criação
+_MTTF_KEYS = ('pods', 'containers', 'worker_nodes', 'worker_node',
+              'worker_components', 'control_plane', 'control_components')
+_MTTR_KEYS = ('worker_nodes', 'worker_components', 'control_components')
+
+# Resultado de _component_spec para componentes desabilitados
+_EXCLUDED_SPEC = (None, None, None, None, None)
+
+def _load_json_file(f, size: int) -> Any:
+    """
+    Decodifica o JSON de um arquivo aberto em modo binário.
+    
+    Com orjson o arquivo é mapeado em memória e decodificado direto das
+    páginas mapeadas, sem a cópia intermediária de f.read().
+    """
+    if orjson is not None and size > 0:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+    return loads_json(f.read())
+
+
+def _load_json_path(path: str) -> Any:
+    """
+    Decodifica um arquivo JSON (ver _load_json_file).
+    
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+    """
+    with open(path, 'rb') as f:
+        return _load_json_file(f, os.fstat(f.fileno()).st_size)
+
+
+@functools.cache
+def _component_class():
+    """
+    Importa Component do simulador na primeira chamada e o reutiliza.
+    
+    O import fica adiado porque o módulo do simulador é pesado e
+    só é necessário ao montar componentes.
+    """
+    from kuber_bomber.simulation.availability_simulator import Component
+    return Component
+
 
 class ConfigPresets:
     """Presets de configuração padrão."""
@@ -19,27 +106,10 @@ class ConfigPresets:
     @staticmethod
     def generate_default_config() -> Dict:
         """Gera configuração padrão."""
-        return {
-            "experiment_config": {
-                "applications": {},
-                "worker_node": {},
-                "control_plane": {}
-            },
-            "mttf_config": {
-                "pods": {},
-                "worker_node": {},
-                "control_plane": {}
-            },
-            "mttr_config": {
-                "pods": {},
-                "worker_node": {},
-                "control_plane": {}
-            },
-            "availability_criteria": {}
-        }
+        return copy.deepcopy(_DEFAULT_TEMPLATE)
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigSimples:
     """
     Configuração simplificada que carrega JSON gerado automaticamente
@@ -64,6 +134,24 @@ class ConfigSimples:
     # ===== CONFIGURAÇÃO AWS (carregada OBRIGATORIAMENTE de aws_config.json) =====
     aws_enabled: bool = False
     aws_config: Optional[Dict] = None  # Será carregado do arquivo aws_config.json
+    # Preenchidos por configure_aws (declarados por causa de __slots__)
+    aws_public_ip: str = ''
+    aws_ssh_key_path: str = ''
+    aws_ssh_user: str = ''
+    
+    # Prefixo do nome (antes do primeiro '-') -> tipo do componente
+    _PREFIX_MAP = {
+        'pod': 'pod',
+        'container': 'container',
+        'worker_node': 'worker_node',
+        'control_plane': 'control_plane',
+    }
+    
+    # Cache do mttf_config achatado (invalidado a cada _load_from_dict)
+    _flat_mttf_cache: Optional[Dict[str, float]] = field(default=None, init=False, repr=False, compare=False)
+    # Índice do mttr_config para get_mttr (invalidado a cada _load_from_dict)
+    _mttr_index: Optional[Tuple[Dict[str, Tuple[int, Any]], Dict[str, Tuple[int, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Inicialização automática."""
@@ -82,18 +170,35 @@ class ConfigSimples:
             Instância configurada
         """
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            config = cls(config_data=data)
-            print(f"✅ Configuração carregada de: {filepath}")
+            config = cls(config_data=_load_json_path(filepath))
+            logger.info("✅ Configuração carregada de: %s", filepath)
             return config
             
         except FileNotFoundError:
-            print(f"❌ Arquivo não encontrado: {filepath}")
+            logger.error("❌ Arquivo não encontrado: %s", filepath)
             return cls()
         except json.JSONDecodeError as e:
-            print(f"❌ Erro ao decodificar JSON: {e}")
+            logger.error("❌ Erro ao decodificar JSON: %s", e)
+            return cls()
+    
+    @classmethod
+    def load_from_bytes(cls, raw: bytes) -> 'ConfigSimples':
+        """
+        Carrega configuração a partir do conteúdo JSON já lido.
+        
+        Útil quando o chamador já abriu o arquivo, evitando
+        uma segunda abertura/stat em load_from_json.
+        
+        Args:
+            raw: Conteúdo do arquivo JSON
+            
+        Returns:
+            Instância configurada
+        """
+        try:
+            return cls(config_data=loads_json(raw))
+        except json.JSONDecodeError as e:
+            logger.error("❌ Erro ao decodificar JSON: %s", e)
             return cls()
     
     @classmethod
@@ -108,29 +213,31 @@ class ConfigSimples:
             Configuração AWS com ssh_host descoberto automaticamente
         """
         try:
-            if os.path.exists(aws_config_file):
-                with open(aws_config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+            # Abrir direto (EAFP) decide a existência sem um stat extra
+            try:
+                config = _load_json_path(aws_config_file)
+            except FileNotFoundError:
+                return {}
+            
+            # Se não tem ssh_host, descobrir automaticamente
+            if 'ssh_host' not in config or not config.get('ssh_host'):
+                logger.info("🔍 ssh_host não encontrado, descobrindo automaticamente...")
                 
-                # Se não tem ssh_host, descobrir automaticamente
-                if 'ssh_host' not in config or not config.get('ssh_host'):
-                    print("🔍 ssh_host não encontrado, descobrindo automaticamente...")
-                    
-                    # Importar discovery
-                    from kuber_bomber.utils.control_plane_discovery import ControlPlaneDiscovery
-                    
-                    discovery = ControlPlaneDiscovery(config)
-                    control_plane_ip = discovery.discover_control_plane_ip()
+                # Importar discovery
+                from kuber_bomber.utils.control_plane_discovery import ControlPlaneDiscovery
+                
+                discovery = ControlPlaneDiscovery(config)
+                control_plane_ip = discovery.discover_control_plane_ip()
+                
+                if control_plane_ip:
+                    config['ssh_host'] = control_plane_ip
+                    logger.info("✅ Control plane descoberto: %s", control_plane_ip)
+                else:
+                    logger.error("❌ Não foi possível descobrir o control plane")
                     
-                    if control_plane_ip:
-                        config['ssh_host'] = control_plane_ip
-                        print(f"✅ Control plane descoberto: {control_plane_ip}")
-                    else:
-                        print("❌ Não foi possível descobrir o control plane")
-                        
-                return config
+            return config
         except Exception as e:
-            print(f"⚠️ Erro ao carregar AWS config: {e}")
+            logger.warning("⚠️ Erro ao carregar AWS config: %s", e)
         
         return {}
     
@@ -149,49 +256,67 @@ class ConfigSimples:
             self.aws_ssh_key_path = aws_config.get('ssh_key', '~/.ssh/vockey.pem')
             self.aws_ssh_user = aws_config.get('ssh_user', 'ubuntu')
             
-            print(f"✅ AWS configurado: {self.aws_ssh_user}@{self.aws_public_ip}")
+            logger.info("✅ AWS configurado: %s@%s", self.aws_ssh_user, self.aws_public_ip)
         else:
-            print("⚠️ Configuração AWS não encontrada")
-            print(aws_config_file)
+            logger.warning("⚠️ Configuração AWS não encontrada: %s", aws_config_file)
     
-    def _load_from_dict(self, data: Dict[str, Any]):
-        """Carrega dados do dicionário JSON."""
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'ConfigSimples':
+        """
+        Cria instância a partir de um dicionário que já segue o schema completo.
+        
+        Pula o preenchimento de chaves padrão feito por _load_from_dict; use
+        apenas com JSON gerado pela descoberta/save_config, que já contém
+        todas as seções aninhadas.
+        
+        Args:
+            data: Dicionário de configuração (não é copiado)
+            
+        Returns:
+            Instância configurada
+        """
+        config = cls()
+        config._load_metadata(data)
+        return config
+    
+    def _load_metadata(self, data: Dict[str, Any]):
+        """Atribui metadados e payload, invalidando os caches derivados."""
         self.timestamp = data.get('timestamp')
         self.duration = data.get('duration', 1000)
         self.iterations = data.get('iterations', 5)
         self.delay = data.get('delay', 10)  # carregar delay do JSON
+        self._flat_mttf_cache = None
+        self._mttr_index = None
         # Armazenar todo o payload para uso posterior
         self.config_data = data
+    
+    def _load_from_dict(self, data: Dict[str, Any]):
+        """Carrega dados do dicionário JSON."""
+        self._load_metadata(data)
+        cd = data
         # Garantir chaves aninhadas mínimas para compatibilidade
-        self.config_data.setdefault('experiment_config', {})
-        exp = self.config_data['experiment_config']
+        exp = cd.setdefault('experiment_config', {})
         exp.setdefault('applications', {})
         # Suporte tanto worker_nodes quanto worker_node (nova estrutura)
         exp.setdefault('worker_nodes', {})
         exp.setdefault('worker_node', {})
         exp.setdefault('control_plane', {})
 
-        self.config_data.setdefault('mttf_config', {})
         # If mttf_config is flat (old format), keep as-is; if nested, ensure subkeys
-        m = self.config_data['mttf_config']
-        if isinstance(m, dict):
+        m = cd.setdefault('mttf_config', {})
+        if type(m) is dict:
             # detect nested structure
-            if any(k in m for k in ('pods', 'containers', 'worker_nodes', 'worker_node', 'worker_components', 'control_plane')):
-                # ensure nested keys exist
-                m.setdefault('pods', {})
-                m.setdefault('containers', {})
-                m.setdefault('worker_nodes', {})
-                m.setdefault('worker_node', {})  # nova estrutura
-                m.setdefault('worker_components', {})
-                m.setdefault('control_plane', {})
-                m.setdefault('control_components', {})
-
-        self.config_data.setdefault('mttr_config', {})
-        mt = self.config_data['mttr_config']
-        if isinstance(mt, dict):
-            mt.setdefault('worker_nodes', {})
-            mt.setdefault('worker_components', {})
-            mt.setdefault('control_components', {})
+            if not _MTTF_NESTED_KEYS.isdisjoint(m):
+                # ensure nested keys exist (inclui worker_node, nova estrutura)
+                for key in _MTTF_KEYS:
+                    if key not in m:
+                        m[key] = {}
+
+        mt = cd.setdefault('mttr_config', {})
+        if type(mt) is dict:
+            for key in _MTTR_KEYS:
+                if key not in mt:
+                    mt[key] = {}
     
     def get_experiment_config(self) -> Dict[str, Any]:
         """Retorna configuração do experimento."""
@@ -214,26 +339,38 @@ class ConfigSimples:
         """
         Retorna uma versão 'achatada' do mttf_config, suportando formatos
         antigos (flat) e novos (aninhados).
+        
+        O resultado é calculado uma vez e reutilizado; não deve ser alterado
+        pelo chamador.
         """
+        if self._flat_mttf_cache is None:
+            self._flat_mttf_cache = self._build_flat_mttf()
+        return self._flat_mttf_cache
+    
+    def _build_flat_mttf(self) -> Dict[str, float]:
+        """Constrói o mttf_config achatado (ver _flatten_mttf)."""
         flat: Dict[str, float] = {}
         m = self.get_mttf_config()
-        if not isinstance(m, dict):
+        if type(m) is not dict:
             return flat
 
-        # Caso já seja formato antigo (chaves como 'pod-...')
-        simple_keys = [k for k in m.keys() if not isinstance(m.get(k), dict)]
-        if simple_keys and not any(k in m for k in ('pods', 'containers')):
-            # assume flat format
+        # Caso já seja formato antigo (chaves como 'pod-...'): sem 'pods'/'containers'
+        # e com ao menos um valor simples. Detecção e cópia numa única passada.
+        if 'pods' not in m and 'containers' not in m:
+            has_simple = False
             for k, v in m.items():
-                if isinstance(v, (int, float)):
-                    flat[k] = v
-            return flat
+                if type(v) is not dict:
+                    has_simple = True
+                    if isinstance(v, _NUMBER):
+                        flat[k] = v
+            if has_simple:
+                return flat
 
         # Caso aninhado - suportar tanto estrutura antiga quanto nova
         
         # Pods (podem estar em 'pods' ou misturados com containers)
         pods_map = m.get('pods')
-        if isinstance(pods_map, dict):
+        if type(pods_map) is dict:
             for pod_name, v in pods_map.items():
                 # Se começa com 'container-', trata como container
                 if pod_name.startswith('container-'):
@@ -243,43 +380,43 @@ class ConfigSimples:
 
         # Containers (estrutura antiga - separada)
         cont_map = m.get('containers')
-        if isinstance(cont_map, dict):
+        if type(cont_map) is dict:
             for cont_name, v in cont_map.items():
                 flat[f"container-{cont_name}"] = v
 
         # Worker nodes - tanto 'worker_nodes' (antiga) quanto 'worker_node' (nova)
         for wn_key in ['worker_nodes', 'worker_node']:
             wn_map = m.get(wn_key)
-            if isinstance(wn_map, dict):
+            if type(wn_map) is dict:
                 for node_name, v in wn_map.items():
                     # Se começa com prefixo de componente, manter como está
-                    if any(node_name.startswith(prefix) for prefix in ['wn_runtime-', 'wn_proxy-', 'wn_kubelet-']):
+                    if node_name.startswith(_WORKER_COMPONENT_PREFIXES):
                         flat[node_name] = v
                     else:
                         flat[f"worker_node-{node_name}"] = v
 
         # Worker components (estrutura antiga - separada)
         wn_comp_map = m.get('worker_components')
-        if isinstance(wn_comp_map, dict):
+        if type(wn_comp_map) is dict:
             for node_name, comps in wn_comp_map.items():
-                if isinstance(comps, dict):
+                if type(comps) is dict:
                     for comp_key, comp_v in comps.items():
                         flat[f"{comp_key}-{node_name}"] = comp_v
 
         cp_map = m.get('control_plane')
-        if isinstance(cp_map, dict):
+        if type(cp_map) is dict:
             for cp_name, v in cp_map.items():
                 # Se começa com prefixo de componente, manter como está
-                if any(cp_name.startswith(prefix) for prefix in ['cp_apiserver-', 'cp_manager-', 'cp_scheduler-', 'cp_etcd-']):
+                if cp_name.startswith(_CONTROL_COMPONENT_PREFIXES):
                     flat[cp_name] = v
                 else:
                     flat[f"control_plane-{cp_name}"] = v
 
         # Control components (estrutura antiga - separada)
         cp_comp_map = m.get('control_components')
-        if isinstance(cp_comp_map, dict):
+        if type(cp_comp_map) is dict:
             for cp_name, comps in cp_comp_map.items():
-                if isinstance(comps, dict):
+                if type(comps) is dict:
                     for comp_key, comp_v in comps.items():
                         flat[f"{comp_key}-{cp_name}"] = comp_v
 
@@ -310,77 +447,70 @@ class ConfigSimples:
         Returns:
             MTTR em horas
         """
-        # Flatten mttr_config for common component keys
-        mt = self.get_mttr_config()
-        if not isinstance(mt, dict):
+        if self._mttr_index is None:
+            self._mttr_index = self._build_mttr_index()
+        by_name, by_type = self._mttr_index
+        
+        direct = by_name.get(component_name)
+        # Fallback por tipo genérico: "wn_runtime-worker-node-1" -> "wn_runtime"
+        head, sep, _ = component_name.partition('-')
+        generic = by_type.get(head) if sep else None
+        
+        # Vale a entrada que a busca original (store por store) encontraria primeiro
+        if direct is None and generic is None:
             return 0.0
-
-        # Direct flat lookup
-        if component_name in mt and isinstance(mt[component_name], (int, float)):
-            return mt[component_name]
-
-        # Check nested structures - tanto antiga quanto nova estrutura
+        if generic is None or (direct is not None and direct[0] < generic[0]):
+            return direct[1]
+        return generic[1]
+    
+    def _build_mttr_index(self) -> Tuple[Dict[str, Tuple[int, Any]], Dict[str, Tuple[int, Any]]]:
+        """
+        Indexa o mttr_config uma única vez para consultas O(1) em get_mttr.
+        
+        Retorna dois dicionários (nome exato e tipo genérico) cujos valores
+        são (ordem, mttr). A ordem reproduz a sequência de busca por store -
+        mttr_config plano, worker_node, worker_nodes, control_plane,
+        worker_components, control_components - testando em cada store o
+        nome exato e depois o tipo genérico.
+        """
+        by_name: Dict[str, Tuple[int, Any]] = {}
+        by_type: Dict[str, Tuple[int, Any]] = {}
+        mt = self.get_mttr_config()
+        if type(mt) is not dict:
+            return by_name, by_type
+        
+        def add_numeric(index, rank, store):
+            for key, val in store.items():
+                if isinstance(val, _NUMBER):
+                    index.setdefault(key, (rank, val))
+        
+        # Busca direta plana
+        add_numeric(by_name, 0, mt)
         
         # Nova estrutura: worker_node: { "wn_runtime": 50.0, "worker_node": 400.0 }
-        # Mapear componentes específicos para valores genéricos
-        for wn_key in ['worker_node', 'worker_nodes']:
-            wn_store = mt.get(wn_key)
-            if isinstance(wn_store, dict):
-                # Busca direta primeiro
-                if component_name in wn_store:
-                    val = wn_store[component_name]
-                    if isinstance(val, (int, float)):
-                        return val
-                
-                # Mapear componente específico para tipo genérico
-                # ex: "wn_runtime-worker-node-1" -> "wn_runtime"
-                if '-' in component_name:
-                    comp_type = component_name.split('-')[0]
-                    if comp_type in wn_store:
-                        val = wn_store[comp_type]
-                        if isinstance(val, (int, float)):
-                            return val
-
-        # Control plane: similar
-        cp_store = mt.get('control_plane')
-        if isinstance(cp_store, dict):
-            # Busca direta primeiro
-            if component_name in cp_store:
-                val = cp_store[component_name]
-                if isinstance(val, (int, float)):
-                    return val
-            
-            # Mapear componente específico para tipo genérico
-            if '-' in component_name:
-                comp_type = component_name.split('-')[0]
-                if comp_type in cp_store:
-                    val = cp_store[comp_type]
-                    if isinstance(val, (int, float)):
-                        return val
-
+        # e estrutura antiga worker_nodes; control plane é similar
+        rank = 1
+        for store_key in ('worker_node', 'worker_nodes', 'control_plane'):
+            store = mt.get(store_key)
+            if type(store) is dict:
+                add_numeric(by_name, rank, store)
+                add_numeric(by_type, rank + 1, store)
+            rank += 2
+        
         # Estrutura antiga: worker_components: { node: { wn_runtime: val, ... } }
-        if isinstance(mt.get('worker_components'), dict):
-            # component_name expected like 'wn_runtime-<node>'
-            if '-' in component_name:
-                key, node = component_name.split('-', 1)
-                comp_store = mt.get('worker_components')
-                if isinstance(comp_store, dict):
-                    comp_map = comp_store.get(node, {})
-                    if isinstance(comp_map, dict) and key in comp_map:
-                        return comp_map[key]
-
-        # control_components similar
-        if isinstance(mt.get('control_components'), dict):
-            if '-' in component_name:
-                key, node = component_name.split('-', 1)
-                comp_store = mt.get('control_components')
-                if isinstance(comp_store, dict):
-                    comp_map = comp_store.get(node, {})
-                    if isinstance(comp_map, dict) and key in comp_map:
-                        return comp_map[key]
-
-        # fallback
-        return 0.0
+        # consultada como "<comp>-<node>"; control_components similar
+        for store_key in ('worker_components', 'control_components'):
+            store = mt.get(store_key)
+            if type(store) is dict:
+                for node, comp_map in store.items():
+                    if type(comp_map) is not dict:
+                        continue
+                    for comp_key, val in comp_map.items():
+                        if '-' not in comp_key:
+                            by_name.setdefault(f"{comp_key}-{node}", (rank, val))
+            rank += 1
+        
+        return by_name, by_type
     
     def get_component_config(self) -> List:
         """
@@ -389,84 +519,69 @@ class ConfigSimples:
         Returns:
             List com componentes configurados baseados no JSON
         """
-        from kuber_bomber.simulation.availability_simulator import Component
-        
-        components = []
+        Component = _component_class()
         flat_mttf = self._flatten_mttf()
 
         exp = self.get_experiment_config()
-        apps_enabled = exp.get('applications', {})
-        # Suportar tanto worker_nodes quanto worker_node
-        nodes_enabled = exp.get('worker_nodes', {})
-        nodes_enabled.update(exp.get('worker_node', {}))  # merge nova estrutura
-        cps_enabled = exp.get('control_plane', {})
-
-        for comp_name, mttf_hours in flat_mttf.items():
-            comp_type = self._extract_component_type(comp_name)
-
-            # Filtrar por flags do experiment_config
-            include = False
-            if comp_type == 'pod':
-                # extrair nome do pod sem prefixo
-                pod_full = comp_name[len('pod-'):]
-                # Verificar se o pod pertence a alguma aplicação habilitada
-                for app_key, enabled in apps_enabled.items():
-                    if not enabled:
-                        continue
-                    if pod_full.startswith(app_key):
-                        include = True
-                        break
-            elif comp_type == 'container':
-                pod_full = comp_name[len('container-'):]
-                for app_key, enabled in apps_enabled.items():
-                    if not enabled:
-                        continue
-                    if pod_full.startswith(app_key):
-                        include = True
-                        break
-            elif comp_type == 'worker_node':
-                node_name = comp_name[len('worker_node-'):]
-                if nodes_enabled.get(node_name):
-                    include = True
-            elif comp_type in ('wn_runtime', 'wn_proxy', 'wn_kubelet'):
-                # formato: wn_runtime-<node>
-                node_name = comp_name.split('-', 1)[1] if '-' in comp_name else ''
-                if nodes_enabled.get(node_name):
-                    include = True
-            elif comp_type == 'control_plane':
-                cp_name = comp_name[len('control_plane-'):]
-                if cps_enabled.get(cp_name):
-                    include = True
-            elif comp_type in ('cp_apiserver', 'cp_manager', 'cp_scheduler', 'cp_etcd'):
-                cp_name = comp_name.split('-', 1)[1] if '-' in comp_name else ''
-                if cps_enabled.get(cp_name):
-                    include = True
-            else:
-                # unknown - by default include
-                include = True
-
-            if not include:
-                continue
-
-            # Extrair chave MTTF para mapear métodos de falha corretamente
-            mttf_key = self._extract_mttf_key(comp_name, comp_type)
-            
-            # Configurar parent_component para containers
-            parent_component = None
-            if comp_type == 'container' and comp_name.startswith('container-'):
-                # container-bar-app-775c8885f5-6wdlt -> bar-app-775c8885f5-6wdlt
-                parent_component = comp_name[len('container-'):]
-
-            component = Component(
+        # Prefixos de aplicações e conjuntos de nós habilitados, calculados uma vez
+        enabled_apps = tuple(app for app, enabled in exp.get('applications', {}).items() if enabled)
+        # Suportar tanto worker_nodes quanto worker_node (nova estrutura prevalece)
+        nodes_enabled = {**exp.get('worker_nodes', {}), **exp.get('worker_node', {})}
+        enabled_nodes = frozenset(node for node, enabled in nodes_enabled.items() if enabled)
+        enabled_cps = frozenset(cp for cp, enabled in exp.get('control_plane', {}).items() if enabled)
+
+        specs = (
+            self._component_spec(comp_name, mttf_hours, enabled_apps, enabled_nodes, enabled_cps)
+            for comp_name, mttf_hours in flat_mttf.items()
+        )
+        return [
+            Component(
                 name=comp_name,
                 component_type=comp_type,
                 mttf_hours=mttf_hours,
                 mttf_key=mttf_key,
                 parent_component=parent_component
             )
-            components.append(component)
+            for comp_name, comp_type, mttf_hours, mttf_key, parent_component in specs
+            if comp_name is not None
+        ]
+    
+    def _component_spec(self, comp_name: str, mttf_hours: float, enabled_apps: Tuple[str, ...],
+                        enabled_nodes: frozenset, enabled_cps: frozenset) -> Tuple:
+        """
+        Decide se um componente entra na simulação e monta seus argumentos.
+        
+        Returns:
+            (nome, tipo, mttf_hours, mttf_key, parent_component), ou uma
+            tupla de None se o componente estiver desabilitado no experiment_config
+        """
+        # tail: nome sem o prefixo de tipo (pod, nó ou control plane)
+        comp_type, tail = self._split_component_name(comp_name)
+
+        # Filtrar por flags do experiment_config
+        if comp_type == 'pod' or comp_type == 'container':
+            # Verificar se o pod pertence a alguma aplicação habilitada
+            include = tail.startswith(enabled_apps)
+        elif comp_type == 'worker_node' or comp_type in ('wn_runtime', 'wn_proxy', 'wn_kubelet'):
+            # formato: wn_runtime-<node>
+            include = tail in enabled_nodes
+        elif comp_type == 'control_plane' or comp_type in ('cp_apiserver', 'cp_manager', 'cp_scheduler', 'cp_etcd'):
+            include = tail in enabled_cps
+        else:
+            # unknown - by default include
+            include = True
 
-        return components
+        if not include:
+            return _EXCLUDED_SPEC
+
+        # Extrair chave MTTF para mapear métodos de falha corretamente
+        mttf_key = self._extract_mttf_key(comp_name, comp_type)
+        
+        # Configurar parent_component para containers
+        # container-bar-app-775c8885f5-6wdlt -> bar-app-775c8885f5-6wdlt
+        parent_component = tail if comp_type == 'container' else None
+
+        return comp_name, comp_type, mttf_hours, mttf_key, parent_component
     
     def _extract_component_type(self, component_name: str) -> str:
         """
@@ -478,20 +593,26 @@ class ConfigSimples:
         Returns:
             Tipo do componente (ex: pod)
         """
-        if component_name.startswith('pod-'):
-            return 'pod'
-        elif component_name.startswith('container-'):
-            return 'container'
-        elif component_name.startswith('worker_node-'):
-            return 'worker_node'
-        elif component_name.startswith('wn_'):
-            return component_name.split('-')[0]  # wn_runtime, wn_proxy, etc.
-        elif component_name.startswith('control_plane-'):
-            return 'control_plane'
-        elif component_name.startswith('cp_'):
-            return component_name.split('-')[0]  # cp_apiserver, cp_manager, etc.
-        else:
-            return 'unknown'
+        return self._split_component_name(component_name)[0]
+    
+    def _split_component_name(self, component_name: str) -> Tuple[str, str]:
+        """
+        Separa o nome do componente em tipo e restante do nome.
+        
+        Args:
+            component_name: Nome do componente (ex: wn_runtime-worker-node-1)
+            
+        Returns:
+            (tipo, restante), ex: ('wn_runtime', 'worker-node-1')
+        """
+        head, sep, tail = component_name.partition('-')
+        if sep:
+            comp_type = self._PREFIX_MAP.get(head)
+            if comp_type:
+                return comp_type, tail
+        if head.startswith(('wn_', 'cp_')):
+            return head, tail  # wn_runtime, wn_proxy, cp_apiserver, cp_manager, etc.
+        return 'unknown', tail
     
     def _extract_mttf_key(self, component_name: str, comp_type: str) -> str:
         """
@@ -527,8 +648,7 @@ class ConfigSimples:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filepath = f"config_simples_used_{timestamp}.json"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(self.config_data, f, indent=2, ensure_ascii=False)
+        write_json_atomic(filepath, self.config_data)
         
         return filepath
     
@@ -566,12 +686,7 @@ class ConfigSimples:
         print(f"🔧 Total MTTR configurados: {len(mttr_config)}")
         
         # Agrupar componentes por tipo
-        components_by_type = {}
-        for comp_name in mttf_config.keys():
-            comp_type = self._extract_component_type(comp_name)
-            if comp_type not in components_by_type:
-                components_by_type[comp_type] = 0
-            components_by_type[comp_type] += 1
+        components_by_type = Counter(map(self._extract_component_type, mttf_config))
         
         for comp_type, count in components_by_type.items():
             print(f"  • {comp_type}: {count} componentes")
@@ -590,11 +705,14 @@ class ConfigSimples:
 
 # Funções auxiliares para validação final
 def _merge_aws_config(config_data: Dict, aws_config: Dict) -> Dict:
-    """Mescla configuração AWS com config de descoberta."""
-    merged = config_data.copy()
+    """
+    Mescla configuração AWS com config de descoberta.
+    
+    Sem aws_config, retorna o próprio config_data (sem cópia).
+    """
     if aws_config:
-        merged['aws_config'] = aws_config
-    return merged
+        return {**config_data, 'aws_config': aws_config}
+    return config_data
 
 
 if __name__ == "__main__":
@@ -8,27 +8,158 @@ para testes de confiabilidade em Kubernetes.
 
 Exemplo básico:
     from kuber_bomber.core.exemplo_uso import ExemploUso
+    from kuber_bomber.utils.logging_config import setup_cli_logging
     
+    setup_cli_logging()  # sem isso as etapas não são exibidas
     exemplo = ExemploUso()
     exemplo.executar_fluxo_completo()
+
+Saída: o progresso das etapas é emitido no logger "kuber_bomber" (nível
+INFO; avisos e erros em WARNING/ERROR). Usado como biblioteca, o pacote é
+silencioso por padrão (NullHandler) até que o chamador configure o logging,
+seja com setup_cli_logging() ou com o seu próprio handler. main() já chama
+setup_cli_logging().
 """
 
+import argparse
 import sys
 import os
+import time
 import json
-from typing import Dict, List, Optional, Tuple
+import logging
+import pickle
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 
-# Adicionar path para imports
+# Diretórios resolvidos uma única vez na importação
 current_dir = os.path.dirname(os.path.abspath(__file__))
 kuber_bomber_dir = os.path.dirname(current_dir)
 project_dir = os.path.dirname(kuber_bomber_dir)
-sys.path.insert(0, kuber_bomber_dir)
-sys.path.insert(0, project_dir)
 
-from kuber_bomber.core.reliability_tester import ReliabilityTester
+# Execução direta do arquivo (sem -m): expor a raiz do projeto para que
+# "import kuber_bomber" funcione. Importado como módulo, sys.path não muda.
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, project_dir)
+
+# Nome fixo: executado como script o __name__ seria "__main__"
+logger = logging.getLogger("kuber_bomber.core.exemplo_uso")
+
+# Caminhos fixos do projeto (calculados uma única vez na importação)
+_CONFIG_FILE = os.path.join(project_dir, "kuber_bomber", "configs", "config_simples_used.json")
+_AWS_CONFIG_FILE = os.path.join(kuber_bomber_dir, "configs", "aws_config.json")
+
 from kuber_bomber.core.config_simples import ConfigSimples, ConfigPresets
-from kuber_bomber.utils.infrastructure_discovery import InfrastructureDiscovery
-from kuber_bomber.utils.mttr_analyzer import MTTRAnalyzer
+from kuber_bomber.utils.logging_config import setup_cli_logging
+
+# Módulos pesados (kubectl/SSH/AWS) carregados apenas quando usados
+_LAZY_IMPORTS = {
+    'ReliabilityTester': 'kuber_bomber.core.reliability_tester',
+    'InfrastructureDiscovery': 'kuber_bomber.utils.infrastructure_discovery',
+    'MTTRAnalyzer': 'kuber_bomber.utils.mttr_analyzer',
+}
+
+
+def __getattr__(name: str):
+    """Importa sob demanda os nomes de _LAZY_IMPORTS (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+# Linha da tabela comparativa de test_recovery_methods
+ROW_FMT = "{name:<20} {rec:<12} {rt:<12.2f} {tt:<12.2f}"
+# (rótulo, chave em results) na ordem de exibição
+RECOVERY_METHODS = (
+    ('Original', 'original_method'),
+    ('Curl', 'curl_method'),
+    ('Combinado', 'combined_method'),
+)
+
+# Respostas aceitas como confirmação nos prompts (s/N)
+_YES = frozenset({'s', 'sim', 'y', 'yes'})
+
+# Segundos em que check_availability(reuse_recent=True) reaproveita o último resultado
+AVAILABILITY_CACHE_TTL = 30
+
+# Tempo máximo de um alvo make (descoberta/análise MTTR/simulação)
+MAKE_TIMEOUT = 1800  # 30 minutos
+
+
+def _load_config_file(config_file: str) -> ConfigSimples:
+    """
+    Carrega o config_simples_used.json como ConfigSimples.
+    
+    Com KB_CONFIG_PICKLE_CACHE=1, o objeto já montado é guardado em
+    `<config_file>.pkl` junto com (mtime_ns, tamanho) do JSON e reaproveitado
+    entre execuções enquanto o JSON não mudar. O sidecar é gerado pelo próprio
+    framework; não habilite a opção em diretórios onde terceiros possam escrever.
+    
+    Args:
+        config_file: Caminho do JSON de configuração
+        
+    Returns:
+        ConfigSimples carregado (vazio se o JSON for inválido)
+    """
+    if os.environ.get('KB_CONFIG_PICKLE_CACHE') != '1':
+        return ConfigSimples.load_from_json(config_file)
+    
+    st = os.stat(config_file)
+    key = (st.st_mtime_ns, st.st_size)
+    pkl_path = config_file + '.pkl'
+    try:
+        with open(pkl_path, 'rb') as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key:
+            return cached_config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        # Sidecar corrompido ou de outra versão: regenerar
+        logger.warning("⚠️ Cache pickle ignorado (%s): %s", pkl_path, e)
+    
+    config = ConfigSimples.load_from_json(config_file)
+    if config.config_data:
+        try:
+            with open(pkl_path, 'wb') as f:
+                pickle.dump((key, config), f, protocol=5)
+        except OSError as e:
+            logger.warning("⚠️ Não foi possível gravar cache pickle: %s", e)
+    return config
+
+
+def _run_make(make_target: str, cwd: str, timeout: int = MAKE_TIMEOUT,
+              env: Optional[Dict[str, str]] = None) -> int:
+    """
+    Executa um alvo do Makefile exibindo a saída em tempo real.
+    
+    O processo herda stdout/stderr do terminal, então a saída do make aparece
+    conforme é produzida, sem passar por pipes nem decodificação em Python.
+    Ctrl+C ou timeout encerram o make em vez de deixá-lo órfão.
+    
+    Args:
+        make_target: Alvo do Makefile (ex: generate_config_all)
+        cwd: Diretório onde está o Makefile
+        timeout: Tempo máximo em segundos
+        env: Ambiente do processo make (padrão: herdado)
+        
+    Returns:
+        Código de saída do make
+        
+    Raises:
+        subprocess.TimeoutExpired: Se o make exceder o timeout
+    """
+    proc = subprocess.Popen(['make', make_target], cwd=cwd, env=env)
+    try:
+        return proc.wait(timeout=timeout)
+    except BaseException:
+        # Timeout ou interrupção: não deixar o make rodando em segundo plano
+        proc.kill()
+        proc.wait()
+        raise
 
 
 class ExemploUso:
@@ -40,9 +171,12 @@ class ExemploUso:
     - run_test(get_config_all=False): Executa teste de confiabilidade
     - check_availability(): Verifica disponibilidade do sistema
     
+    As etapas são reportadas via logging (ver docstring do módulo): chame
+    setup_cli_logging() antes para exibi-las no terminal.
+    
     Uso recomendado:
     
-        # 1. Criar instância
+        # 1. Criar instância (após setup_cli_logging())
         exemplo = ExemploUso()
         
         # 2. Obter configuração (descoberta automática)
@@ -55,21 +189,76 @@ class ExemploUso:
         disponibilidade = exemplo.check_availability()
     """
     
-    def __init__(self, use_aws: bool = False):
+    def __init__(self, use_aws: bool = False, probe_workers: int = 6, assume_yes: bool = False):
         """
         Inicializa a classe de exemplo.
         
         Args:
             use_aws: Se deve usar ambiente AWS (padrão: False para Kind/local)
+            probe_workers: Máximo de verificações simultâneas contra o cluster
+                (limita conexões kubectl/curl/SSH abertas ao mesmo tempo)
+            assume_yes: Se True, confirmações (s/N) são aceitas sem perguntar
         """
         self.use_aws = use_aws
+        self.assume_yes = assume_yes
         self.tester = None
         self.config = None
         self.discovered_apps = []
+        # Threads são criadas sob demanda pelo executor
+        self._probe_pool = ThreadPoolExecutor(max_workers=probe_workers, thread_name_prefix='probe')
+        # Configurações já obtidas nesta sessão: (iterations, run_mttr_analysis, use_aws) -> config
+        self._config_cache: Dict[Tuple[int, bool, bool], ConfigSimples] = {}
+        # ReliabilityTester por configuração AWS (evita refazer conexões a cada teste)
+        self._tester_cache: Dict[frozenset, Any] = {}
+        # HealthChecker reutilizado enquanto self.config for o mesmo objeto
+        self.health_checker = None
+        self._health_checker_config_id = None
+        # Última simulação de disponibilidade: (instante, (use_aws, mtime do config), resultado)
+        self._avail_cache: Tuple[float, Optional[Tuple[bool, int]], Optional[Dict]] = (0.0, None, None)
+        
+        logger.info("✅ Exemplo initializado - Modo: %s", 'AWS' if use_aws else 'Local')
+    
+    def _get_tester(self, aws_config: Optional[Dict] = None):
+        """
+        Retorna o ReliabilityTester para a configuração AWS, criando-o uma única vez.
+        
+        Args:
+            aws_config: Configuração AWS (None para modo local)
+            
+        Returns:
+            ReliabilityTester reutilizável
+        """
+        key = frozenset((aws_config or {}).items())
+        tester = self._tester_cache.get(key)
+        if tester is None:
+            from kuber_bomber.core.reliability_tester import ReliabilityTester
+            tester = ReliabilityTester(aws_config=aws_config)
+            self._tester_cache[key] = tester
+        return tester
+    
+    def _get_health_checker(self):
+        """
+        Retorna o HealthChecker, recriando-o apenas se a configuração mudou.
         
-        print(f"✅ Exemplo initializado - Modo: {'AWS' if use_aws else 'Local'}")
+        Returns:
+            HealthChecker configurado para o modo atual (AWS ou local)
+        """
+        config_id = id(self.config)
+        if self.health_checker is None or config_id != self._health_checker_config_id:
+            from kuber_bomber.monitoring.health_checker import HealthChecker
+            aws_config = None
+            if self.use_aws and self.config:
+                aws_config = self.config.get_aws_config()
+            self.health_checker = HealthChecker(aws_config=aws_config)
+            self._health_checker_config_id = config_id
+        return self.health_checker
+    
+    def invalidate_config_cache(self):
+        """Descarta as configurações memorizadas por get_config nesta instância."""
+        self._config_cache.clear()
     
-    def get_config(self, iterations: int = 5, run_mttr_analysis: bool = False) -> Optional[ConfigSimples]:
+    def get_config(self, iterations: int = 5, run_mttr_analysis: bool = False,
+                   parallel_mttr: int = 1) -> Optional[ConfigSimples]:
         """
         Obtém a configuração da infraestrutura via descoberta automática.
         
@@ -80,88 +269,94 @@ class ExemploUso:
         Args:
             iterations: Número de iterações para simulação (padrão: 5)
             run_mttr_analysis: Se deve executar análise MTTR completa (padrão: False)
+            parallel_mttr: Componentes testados simultaneamente na análise MTTR
+                (padrão: 1, em série). Experimental: valores > 1 distorcem o MTTR.
+                Repassado ao make via KUBER_BOMBER_MTTR_PARALLELISM
             
         Returns:
             ConfigSimples com configuração completa ou None se falhar
         """
-        print("\n📋 === ETAPA 1: OBTER CONFIGURAÇÃO ===\n")
+        logger.info("\n📋 === ETAPA 1: OBTER CONFIGURAÇÃO ===\n")
+        
+        cache_key = (iterations, run_mttr_analysis, self.use_aws)
+        cached = self._config_cache.get(cache_key)
+        if cached is not None:
+            logger.info("♻️ Configuração já obtida nesta sessão com os mesmos parâmetros")
+            logger.info("   (use invalidate_config_cache() para forçar nova descoberta)")
+            self.config = cached
+            return cached
         
         try:
-            import subprocess
-            import os
-            
             # Preparar comando make
+            make_env = None
             if run_mttr_analysis:
-                print("🧪 Executando descoberta + análise MTTR completa...")
-                print("   📊 Isso irá executar testes reais para medir tempos de recuperação")
-                print("   ⏰ Tempo estimado: 10-20 minutos dependendo do cluster")
+                logger.info("🧪 Executando descoberta + análise MTTR completa...")
+                logger.info("   📊 Isso irá executar testes reais para medir tempos de recuperação")
+                logger.info("   ⏰ Tempo estimado: 10-20 minutos dependendo do cluster")
                 
                 if self.use_aws:
                     make_target = 'generate_config_all_aws'
                 else:
                     make_target = 'generate_config_all'
+                
+                if parallel_mttr > 1:
+                    logger.warning("   ⚠️ EXPERIMENTAL: %s componentes testados em paralelo; "
+                                   "MTTR não comparável ao de uma análise em série", parallel_mttr)
+                    make_env = dict(os.environ, KUBER_BOMBER_MTTR_PARALLELISM=str(parallel_mttr))
             else:
-                print("🔍 Executando descoberta básica com MTTF padrão...")
+                logger.info("🔍 Executando descoberta básica com MTTF padrão...")
                 
                 if self.use_aws:
                     make_target = 'generate_config_aws'
                 else:
                     make_target = 'generate_config'
             
-            print(f"🚀 Executando: make {make_target}")
-            print()
+            logger.info("🚀 Executando: make %s", make_target)
+            logger.info("")
             
             # Executar comando make
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            
-            result = subprocess.run(
-                ['make', make_target],
-                cwd=project_root,
-                text=True,
-                timeout=1800  # 30 minutos de timeout
-            )
+            returncode = _run_make(make_target, cwd=project_dir, env=make_env)
             
-            if result.returncode == 0:
-                print("\n✅ Comando make executado com sucesso!")
+            if returncode == 0:
+                logger.info("\n✅ Comando make executado com sucesso!")
                 
                 # Carregar configuração gerada
-                config_file = os.path.join(project_root, "kuber_bomber", "configs", "config_simples_used.json")
+                config_file = _CONFIG_FILE
                 
                 if os.path.exists(config_file):
-                    print(f"📂 Carregando configuração de: {config_file}")
+                    logger.info("📂 Carregando configuração de: %s", config_file)
                     
-                    with open(config_file, 'r') as f:
-                        config_data = json.load(f)
-                    
-                    # Criar objeto ConfigSimples
-                    from kuber_bomber.core.config_simples import ConfigSimples
-                    config = ConfigSimples(config_data=config_data)
+                    # Reaproveita o JSON já decodificado (ou o pickle, se habilitado)
+                    # enquanto o arquivo não mudar
+                    config = _load_config_file(config_file)
+                    if not config.config_data:
+                        logger.error("❌ Configuração inválida ou vazia: %s", config_file)
+                        return None
                     
                     # Configurar AWS se necessário
                     if self.use_aws:
                         config.configure_aws()
                     
                     self.config = config
+                    self._config_cache[cache_key] = config
                     
-                    print("✅ Configuração carregada com sucesso!")
+                    logger.info("✅ Configuração carregada com sucesso!")
                     if run_mttr_analysis:
-                        print("📊 Análise MTTR completa executada - tempos reais medidos")
+                        logger.info("📊 Análise MTTR completa executada - tempos reais medidos")
                     
                     return config
                 else:
-                    print(f"❌ Arquivo de configuração não encontrado: {config_file}")
+                    logger.error("❌ Arquivo de configuração não encontrado: %s", config_file)
                     return None
             else:
-                print(f"❌ Comando make falhou com código: {result.returncode}")
+                logger.error("❌ Comando make falhou com código: %s", returncode)
                 return None
                 
         except subprocess.TimeoutExpired:
-            print("❌ Timeout - processo demorou mais que 30 minutos")
+            logger.error("❌ Timeout - processo demorou mais que 30 minutos")
             return None
         except Exception as e:
-            print(f"❌ Erro ao executar comando: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Erro ao executar comando: %s", e)
             return None
     
     def run_test(self, 
@@ -199,42 +394,42 @@ class ExemploUso:
             ... )
             >>> print(f"✅ Teste completado com {len(resultados)} iterações")
         """
-        print("\n🧪 === ETAPA 2: EXECUTAR TESTE ===\n")
+        logger.info("\n🧪 === ETAPA 2: EXECUTAR TESTE ===\n")
         
         try:
             # Etapa 0: Descoberta + MTTR se solicitado
             if get_config_all:
-                print("📊 Executando descoberta + análise MTTR...")
+                logger.info("📊 Executando descoberta + análise MTTR...")
                 self.config = self.get_config(run_mttr_analysis=True)
                 if not self.config:
-                    print("❌ Falha ao obter configuração")
+                    logger.error("❌ Falha ao obter configuração")
                     return []
             
             # Etapa 1: Obter ou usar configuração existente
             if not self.config:
-                print("📋 Obtendo configuração...")
+                logger.info("📋 Obtendo configuração...")
                 self.config = self.get_config()
                 if not self.config:
-                    print("❌ Falha ao obter configuração")
+                    logger.error("❌ Falha ao obter configuração")
                     return []
             
             # Etapa 2: Criar testador
-            print("🔧 Inicializando testador de confiabilidade...")
+            logger.info("🔧 Inicializando testador de confiabilidade...")
             aws_config = None
             if self.use_aws:
-                try:
-                    aws_config = self.config.get_aws_config()
-                except:
-                    pass
+                # self.config pode ser None se get_config falhou sem levantar exceção
+                get_aws_config = getattr(self.config, 'get_aws_config', None)
+                if get_aws_config is not None:
+                    aws_config = get_aws_config()
             
-            self.tester = ReliabilityTester(aws_config=aws_config)
+            self.tester = self._get_tester(aws_config)
             
             # Etapa 3: Executar teste
-            print(f"\n🎯 Executando teste:")
-            print(f"   📦 Componente: {component_type}")
-            print(f"   🔨 Método: {failure_method}")
-            print(f"   🔢 Iterações: {iterations}")
-            print(f"   ⏱️ Intervalo: {interval}s")
+            logger.info("\n🎯 Executando teste:")
+            logger.info("   📦 Componente: %s", component_type)
+            logger.info("   🔨 Método: %s", failure_method)
+            logger.info("   🔢 Iterações: %s", iterations)
+            logger.info("   ⏱️ Intervalo: %ss", interval)
             
             results = self.tester.run_reliability_test(
                 component_type=component_type,
@@ -243,22 +438,26 @@ class ExemploUso:
                 interval=interval
             )
             
-            print(f"\n✅ Teste completado!")
-            print(f"   📊 Resultados: {len(results)} iterações executadas")
+            logger.info("\n✅ Teste completado!")
+            logger.info("   📊 Resultados: %s iterações executadas", len(results))
             
             if results:
-                recovery_times = [r['recovery_time_seconds'] for r in results if r['recovered']]
-                if recovery_times:
-                    avg_mttr = sum(recovery_times) / len(recovery_times)
-                    print(f"   ⏱️ MTTR médio: {avg_mttr:.2f}s")
-                    print(f"   ✅ Taxa de sucesso: {len(recovery_times)}/{len(results)} ({len(recovery_times)/len(results)*100:.1f}%)")
+                # Soma e contagem numa única passada, sem lista intermediária
+                total_recovery = 0.0
+                recovered_count = 0
+                for r in results:
+                    if r['recovered']:
+                        total_recovery += r['recovery_time_seconds']
+                        recovered_count += 1
+                if recovered_count:
+                    avg_mttr = total_recovery / recovered_count
+                    logger.info("   ⏱️ MTTR médio: %.2fs", avg_mttr)
+                    logger.info("   ✅ Taxa de sucesso: %s/%s (%.1f%%)", recovered_count, len(results), recovered_count/len(results)*100)
             
             return results
             
         except Exception as e:
-            print(f"❌ Erro ao executar teste: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Erro ao executar teste: %s", e)
             return []
     
     def check_pods_health(self) -> Dict:
@@ -273,54 +472,58 @@ class ExemploUso:
         Returns:
             Dicionário com resultados das verificações
         """
-        print("\n🔍 === VERIFICAÇÃO DE SAÚDE DOS PODS ===\n")
+        logger.info("\n🔍 === VERIFICAÇÃO DE SAÚDE DOS PODS ===\n")
         
         try:
-            # Inicializar health_checker se necessário
-            if not hasattr(self, 'health_checker') or not self.health_checker:
-                from kuber_bomber.monitoring.health_checker import HealthChecker
-                aws_config = None
-                if self.use_aws and self.config:
-                    aws_config = self.config.get_aws_config()
-                self.health_checker = HealthChecker(aws_config=aws_config)
+            hc = self._get_health_checker()
             
             results = {}
             
-            # 1. Verificação via status Running
-            print("📋 MÉTODO 1: Verificando status 'Running' dos pods...")
-            print("-" * 50)
-            all_running, running_details = self.health_checker.check_pods_running_status(verbose=True)
+            # As três verificações são independentes: executá-las em paralelo,
+            # sem saída detalhada para não intercalar as mensagens de cada uma
+            logger.info("📋 MÉTODO 1: status 'Running' | 🌐 MÉTODO 2: curl | 🔍 MÉTODO 3: combinado")
+            logger.info("   Executando as verificações em paralelo...")
+            logger.info("-" * 50)
+            futures = {
+                self._probe_pool.submit(hc.check_pods_running_status, verbose=False): 'running_check',
+                self._probe_pool.submit(hc.check_pods_via_curl, verbose=False): 'curl_check',
+                self._probe_pool.submit(hc.check_pods_combined, verbose=False): 'combined_check',
+            }
+            checks = {}
+            for future in as_completed(futures):
+                checks[futures[future]] = future.result()
+            
+            all_running, running_details = checks['running_check']
+            all_responding, curl_details = checks['curl_check']
+            all_healthy, combined_details = checks['combined_check']
             results['running_check'] = {
                 'all_running': all_running,
                 'details': running_details
             }
-            
-            # 2. Verificação via curl
-            print("\n🌐 MÉTODO 2: Verificando pods via curl...")
-            print("-" * 50)
-            all_responding, curl_details = self.health_checker.check_pods_via_curl(verbose=True)
             results['curl_check'] = {
                 'all_responding': all_responding,
                 'details': curl_details
             }
-            
-            # 3. Verificação combinada
-            print("\n🔍 MÉTODO 3: Verificação combinada (Running + Curl)...")
-            print("-" * 50)
-            all_healthy, combined_details = self.health_checker.check_pods_combined(verbose=True)
             results['combined_check'] = {
                 'all_healthy': all_healthy,
                 'details': combined_details
             }
             
+            ready_pods = sum(1 for details in running_details.values() if details['running_and_ready'])
+            responding_pods = sum(1 for details in curl_details.values() if details['responding'])
+            healthy_pods = sum(1 for details in combined_details.values() if details['healthy'])
+            logger.info("📊 Pods Running e Ready: %s/%s", ready_pods, len(running_details))
+            logger.info("📊 Pods respondendo via curl: %s/%s", responding_pods, len(curl_details))
+            logger.info("📊 Pods saudáveis (Running + Respondendo): %s/%s", healthy_pods, len(combined_details))
+            
             # Resumo
-            print("\n📊 === RESUMO DA VERIFICAÇÃO ===")
-            print(f"✅ Todos Running: {'Sim' if all_running else 'Não'}")
-            print(f"🌐 Todos respondendo curl: {'Sim' if all_responding else 'Não'}")
-            print(f"🔍 Todos saudáveis (combinado): {'Sim' if all_healthy else 'Não'}")
+            logger.info("\n📊 === RESUMO DA VERIFICAÇÃO ===")
+            logger.info("✅ Todos Running: %s", 'Sim' if all_running else 'Não')
+            logger.info("🌐 Todos respondendo curl: %s", 'Sim' if all_responding else 'Não')
+            logger.info("🔍 Todos saudáveis (combinado): %s", 'Sim' if all_healthy else 'Não')
             
             if not all_healthy:
-                print("\n⚠️ PROBLEMAS DETECTADOS:")
+                logger.warning("\n⚠️ PROBLEMAS DETECTADOS:")
                 for pod_name, details in combined_details.items():
                     if not details['healthy']:
                         issues = []
@@ -328,14 +531,12 @@ class ExemploUso:
                             issues.append(f"Status: {details['status']}")
                         if not details['responding_curl']:
                             issues.append("Não responde curl")
-                        print(f"   ❌ {pod_name}: {', '.join(issues)}")
+                        logger.warning("   ❌ %s: %s", pod_name, ', '.join(issues))
             
             return results
             
         except Exception as e:
-            print(f"❌ Erro ao verificar saúde dos pods: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Erro ao verificar saúde dos pods: %s", e)
             return {}
     
     def test_recovery_methods(self) -> Dict:
@@ -350,157 +551,145 @@ class ExemploUso:
         Returns:
             Dicionário com tempos de cada método
         """
-        print("\n⏱️ === TESTE DOS MÉTODOS DE RECUPERAÇÃO ===\n")
-        print("Este teste verifica os diferentes métodos de aguardar recuperação.")
-        print("NOTA: Execute apenas quando o sistema estiver estável!")
-        print()
+        logger.info("\n⏱️ === TESTE DOS MÉTODOS DE RECUPERAÇÃO ===\n")
+        logger.info("Este teste verifica os diferentes métodos de aguardar recuperação.")
+        logger.info("NOTA: Execute apenas quando o sistema estiver estável!")
+        logger.info("")
         
-        confirm = input("Continuar com teste de recuperação? (s/N): ").lower().strip()
-        if confirm not in ['s', 'sim', 'y', 'yes']:
-            print("Teste cancelado.")
+        if not _confirm("Continuar com teste de recuperação? (s/N): ", self.assume_yes):
+            logger.info("Teste cancelado.")
             return {}
         
         try:
-            # Inicializar health_checker se necessário
-            if not hasattr(self, 'health_checker') or not self.health_checker:
-                from kuber_bomber.monitoring.health_checker import HealthChecker
-                aws_config = None
-                if self.use_aws and self.config:
-                    aws_config = self.config.get_aws_config()
-                self.health_checker = HealthChecker(aws_config=aws_config)
+            health_checker = self._get_health_checker()
             
             results = {}
             
-            # 1. Método original (HTTP applications)
-            print("1️⃣ MÉTODO ORIGINAL: wait_for_recovery")
-            print("   Verifica aplicações via HTTP endpoints")
-            import time
-            start_time = time.time()
-            recovered, recovery_time = self.health_checker.wait_for_recovery(timeout=30)
-            method1_time = time.time() - start_time
-            results['original_method'] = {
-                'recovered': recovered,
-                'recovery_time': recovery_time,
-                'total_time': method1_time
+            # Os três métodos observam a mesma recuperação: aguardá-los em
+            # paralelo limita o tempo total ao método mais lento, em vez da soma
+            logger.info("1️⃣ MÉTODO ORIGINAL: wait_for_recovery")
+            logger.info("   Verifica aplicações via HTTP endpoints")
+            logger.info("2️⃣ MÉTODO CURL: wait_for_pods_recovery")
+            logger.info("   Verifica pods via curl direto nos IPs")
+            logger.info("3️⃣ MÉTODO COMBINADO: wait_for_pods_recovery_combined")
+            logger.info("   Verifica pods via status Running + curl")
+            logger.info("   ⚡ Executando em paralelo (as mensagens dos métodos podem se intercalar)")
+            logger.info("")
+            
+            def timed(wait, *args, **kwargs):
+                start_time = time.monotonic()
+                recovered, recovery_time = wait(*args, **kwargs)
+                return recovered, recovery_time, time.monotonic() - start_time
+            
+            futures = {
+                self._probe_pool.submit(timed, health_checker.wait_for_recovery, timeout=30): 'original_method',
+                self._probe_pool.submit(timed, health_checker.wait_for_pods_recovery): 'curl_method',
+                self._probe_pool.submit(timed, health_checker.wait_for_pods_recovery_combined, timeout=30): 'combined_method',
             }
-            print(f"   ✅ Resultado: {'Recuperado' if recovered else 'Timeout'} em {recovery_time:.2f}s")
-            
-            # 2. Método via curl
-            print("\n2️⃣ MÉTODO CURL: wait_for_pods_recovery")
-            print("   Verifica pods via curl direto nos IPs")
-            start_time = time.time()
-            recovered, recovery_time = self.health_checker.wait_for_pods_recovery()
-            method2_time = time.time() - start_time
-            results['curl_method'] = {
-                'recovered': recovered,
-                'recovery_time': recovery_time,
-                'total_time': method2_time
-            }
-            print(f"   ✅ Resultado: {'Recuperado' if recovered else 'Timeout'} em {recovery_time:.2f}s")
-            
-            # 3. Método combinado
-            print("\n3️⃣ MÉTODO COMBINADO: wait_for_pods_recovery_combined")
-            print("   Verifica pods via status Running + curl")
-            start_time = time.time()
-            recovered, recovery_time = self.health_checker.wait_for_pods_recovery_combined(timeout=30)
-            method3_time = time.time() - start_time
-            results['combined_method'] = {
-                'recovered': recovered,
-                'recovery_time': recovery_time,
-                'total_time': method3_time
-            }
-            print(f"   ✅ Resultado: {'Recuperado' if recovered else 'Timeout'} em {recovery_time:.2f}s")
+            labels = dict((key, name) for name, key in RECOVERY_METHODS)
+            for future in as_completed(futures):
+                key = futures[future]
+                recovered, recovery_time, total_time = future.result()
+                results[key] = {
+                    'recovered': recovered,
+                    'recovery_time': recovery_time,
+                    'total_time': total_time
+                }
+                logger.info("   ✅ Resultado (%s): %s em %.2fs", labels[key], 'Recuperado' if recovered else 'Timeout', recovery_time)
             
             # Comparação
-            print("\n📊 === COMPARAÇÃO DOS MÉTODOS ===")
-            print(f"{'Método':<20} {'Recuperado':<12} {'Tempo (s)':<12} {'Total (s)':<12}")
-            print("-" * 56)
-            print(f"{'Original':<20} {'Sim' if results['original_method']['recovered'] else 'Não':<12} {results['original_method']['recovery_time']:<12.2f} {results['original_method']['total_time']:<12.2f}")
-            print(f"{'Curl':<20} {'Sim' if results['curl_method']['recovered'] else 'Não':<12} {results['curl_method']['recovery_time']:<12.2f} {results['curl_method']['total_time']:<12.2f}")
-            print(f"{'Combinado':<20} {'Sim' if results['combined_method']['recovered'] else 'Não':<12} {results['combined_method']['recovery_time']:<12.2f} {results['combined_method']['total_time']:<12.2f}")
+            logger.info("\n📊 === COMPARAÇÃO DOS MÉTODOS ===")
+            logger.info("%-20s %-12s %-12s %-12s", 'Método', 'Recuperado', 'Tempo (s)', 'Total (s)')
+            logger.info("-" * 56)
+            for name, key in RECOVERY_METHODS:
+                r = results[key]
+                logger.info(ROW_FMT.format(name=name, rec='Sim' if r['recovered'] else 'Não',
+                                           rt=r['recovery_time'], tt=r['total_time']))
             
             return results
             
         except Exception as e:
-            print(f"❌ Erro ao testar métodos de recuperação: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Erro ao testar métodos de recuperação: %s", e)
             return {}
+    
+    def check_availability(self, reuse_recent: bool = False) -> Optional[Dict]:
         """
         Executa simulação de disponibilidade usando configuração existente.
         
         Este método usa o comando make run_simulation_aws/run_simulation que executa
         a simulação completa de disponibilidade baseada no config_simples_used.json.
         
+        Por padrão a simulação sempre é executada. Com reuse_recent=True, um
+        resultado obtido há menos de AVAILABILITY_CACHE_TTL segundos, com o mesmo
+        arquivo de configuração, é reaproveitado (chamadas internas em sequência).
+        
+        Args:
+            reuse_recent: Se True, reaproveita um resultado recente em vez de
+                repetir a simulação
+        
         Returns:
             Dicionário com resultados da simulação ou None se falhar
         """
-        print("\n🔍 === ETAPA 3: EXECUTAR SIMULAÇÃO DE DISPONIBILIDADE ===\n")
+        logger.info("\n🔍 === ETAPA 3: EXECUTAR SIMULAÇÃO DE DISPONIBILIDADE ===\n")
         
         try:
-            import subprocess
-            import os
-            
             # Verificar se há configuração
-            config_file = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
-                "kuber_bomber", "configs", "config_simples_used.json"
-            )
+            config_file = _CONFIG_FILE
             
             if not os.path.exists(config_file):
-                print("❌ Configuração não encontrada!")
-                print("� Execute primeiro 'Get_Config' ou 'get_config_all' para gerar a configuração")
+                logger.error("❌ Configuração não encontrada!")
+                logger.info("� Execute primeiro 'Get_Config' ou 'get_config_all' para gerar a configuração")
                 return None
             
-            print("📊 Executando simulação de disponibilidade...")
-            print("   📋 Usando configuração existente")
-            print("   ⏰ Aguarde enquanto a simulação é executada...")
+            cache_key = (self.use_aws, os.stat(config_file).st_mtime_ns)
+            cached_at, cached_key, cached_result = self._avail_cache
+            if (reuse_recent and cached_key == cache_key
+                    and time.monotonic() - cached_at < AVAILABILITY_CACHE_TTL):
+                logger.info("♻️ Usando simulação executada há instantes com a mesma configuração")
+                return cached_result
+            
+            logger.info("📊 Executando simulação de disponibilidade...")
+            logger.info("   📋 Usando configuração existente")
+            logger.info("   ⏰ Aguarde enquanto a simulação é executada...")
             
             # Escolher comando baseado no contexto
             if self.use_aws:
                 make_target = 'run_simulation_aws'
-                print("☁️ Modo: Simulação AWS")
+                logger.info("☁️ Modo: Simulação AWS")
             else:
                 make_target = 'run_simulation'
-                print("🏠 Modo: Simulação Local")
+                logger.info("🏠 Modo: Simulação Local")
             
-            print(f"🚀 Executando: make {make_target}")
-            print()
+            logger.info("🚀 Executando: make %s", make_target)
+            logger.info("")
             
             # Executar comando make
-            project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-            
-            result = subprocess.run(
-                ['make', make_target],
-                cwd=project_root,
-                text=True,
-                timeout=1800  # 30 minutos de timeout
-            )
+            returncode = _run_make(make_target, cwd=project_dir)
             
-            if result.returncode == 0:
-                print("\n✅ Simulação de disponibilidade executada com sucesso!")
-                print("📊 Resultados:")
-                print("   📁 Verifique os arquivos CSV gerados na pasta reports/")
-                print("   📈 Métricas de disponibilidade calculadas")
+            if returncode == 0:
+                logger.info("\n✅ Simulação de disponibilidade executada com sucesso!")
+                logger.info("📊 Resultados:")
+                logger.info("   📁 Verifique os arquivos CSV gerados na pasta reports/")
+                logger.info("   📈 Métricas de disponibilidade calculadas")
                 
                 # Retornar resultado básico
-                return {
+                result = {
                     'simulation_completed': True,
                     'command': f'make {make_target}',
                     'reports_location': 'reports/',
                     'status': 'success'
                 }
+                self._avail_cache = (time.monotonic(), cache_key, result)
+                return result
             else:
-                print(f"❌ Simulação falhou com código: {result.returncode}")
+                logger.error("❌ Simulação falhou com código: %s", returncode)
                 return None
                 
         except subprocess.TimeoutExpired:
-            print("❌ Timeout - simulação demorou mais que 30 minutos")
+            logger.error("❌ Timeout - simulação demorou mais que 30 minutos")
             return None
         except Exception as e:
-            print(f"❌ Erro ao executar simulação: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("❌ Erro ao executar simulação: %s", e)
             return None
     
     def executar_fluxo_completo(self):
@@ -516,34 +705,26 @@ class ExemploUso:
             >>> exemplo = ExemploUso()
             >>> exemplo.executar_fluxo_completo()
         """
-        print("\n" + "="*60)
-        print("🚀 FLUXO COMPLETO DE TESTES - KUBER BOMBER")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("🚀 FLUXO COMPLETO DE TESTES - KUBER BOMBER")
+        logger.info("="*60)
         
         # Passo 1: Configuração
         config = self.get_config(run_mttr_analysis=True)
         if not config:
-            print("❌ Falha na obtenção de configuração. Abortando.")
+            logger.error("❌ Falha na obtenção de configuração. Abortando.")
             return
         
         # Passo 2: Verificar disponibilidade
         availability = self.check_availability()
         if not availability:
-            print("❌ Falha na verificação de disponibilidade. Abortando.")
+            logger.error("❌ Falha na verificação de disponibilidade. Abortando.")
             return
         
-        if availability['percentage'] < 80:
-            print(f"⚠️ ATENÇÃO: Disponibilidade baixa ({availability['percentage']:.1f}%)")
-            print("   Recomenda-se verificar o cluster antes de continuar")
-            confirmacao = input("Continuar com teste mesmo assim? (s/N): ").lower().strip()
-            if confirmacao not in ['s', 'sim', 'y', 'yes']:
-                print("Teste cancelado.")
-                return
-        
         # Passo 3: Executar teste
-        print("\n" + "="*60)
-        print("Iniciando teste de confiabilidade...")
-        print("="*60)
+        logger.info("\n" + "="*60)
+        logger.info("Iniciando teste de confiabilidade...")
+        logger.info("="*60)
         
         resultados = self.run_test(
             component_type='control_plane',
@@ -553,38 +734,107 @@ class ExemploUso:
         )
         
         # Resumo final
-        print("\n" + "="*60)
-        print("📊 RESUMO FINAL")
-        print("="*60)
-        print(f"✅ Teste concluído com sucesso!")
-        print(f"   📁 Resultados: {len(resultados)} iterações")
-        print(f"   🎯 Próximos passos:")
-        print(f"      1. Revisar os CSV gerados em reports/")
-        print(f"      2. Analisar os tempos de recuperação (MTTR)")
-        print(f"      3. Ajustar configuração se necessário")
-        print()
+        logger.info("\n" + "="*60)
+        logger.info("📊 RESUMO FINAL")
+        logger.info("="*60)
+        logger.info("✅ Teste concluído com sucesso!")
+        logger.info("   📁 Resultados: %s iterações", len(resultados))
+        logger.info("   🎯 Próximos passos:")
+        logger.info("      1. Revisar os CSV gerados em reports/")
+        logger.info("      2. Analisar os tempos de recuperação (MTTR)")
+        logger.info("      3. Ajustar configuração se necessário")
+        logger.info("")
 
 
-def main():
+def _confirm(prompt: str, assume_yes: bool = False) -> bool:
+    """
+    Pede confirmação (s/N) ao usuário.
+    
+    Args:
+        prompt: Pergunta exibida
+        assume_yes: Se True, confirma sem perguntar (execução não interativa)
+        
+    Returns:
+        True se confirmado
+    """
+    if assume_yes:
+        print(f"{prompt}s (--yes)")
+        return True
+    return input(prompt).lower().strip() in _YES
+
+
+def _start_cluster_probe():
+    """
+    Inicia `kubectl cluster-info` em segundo plano.
+    
+    Returns:
+        Processo em execução, ou a exceção se o kubectl não pôde ser iniciado
+    """
+    try:
+        # Só o código de saída importa: descartar a saída sem bufferizar/decodificar
+        return subprocess.Popen(['kubectl', 'cluster-info'],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except OSError as e:
+        return e
+
+
+def _stop_cluster_probe(cluster_probe) -> None:
+    """Encerra a verificação do cluster se ela ainda estiver rodando."""
+    if isinstance(cluster_probe, subprocess.Popen) and cluster_probe.poll() is None:
+        cluster_probe.kill()
+        cluster_probe.wait()
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Cria o parser de argumentos do exemplo interativo."""
+    parser = argparse.ArgumentParser(
+        description="Kuber Bomber - Exemplo de uso (menu interativo)"
+    )
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help='Aceitar todas as confirmações (s/N) sem perguntar')
+    parser.add_argument('--mode', choices=['local', 'aws'],
+                        help='Contexto de execução (pula a pergunta inicial)')
+    parser.add_argument('--menu', type=int, choices=range(0, 7), metavar='{0-6}',
+                        help='Executa apenas esta opção do menu e encerra')
+    parser.add_argument('--mttr-parallelism', type=int, default=1,
+                        help='EXPERIMENTAL: componentes testados em paralelo na análise MTTR; '
+                             'falhas sobrepostas distorcem o MTTR (padrão: 1, em série)')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Exibir apenas avisos e erros das etapas (o menu continua visível)')
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
     """Função principal para executar exemplo interativo."""
+    args = _build_parser().parse_args(argv)
+    setup_cli_logging(quiet=args.quiet)
+    
     print("="*60)
     print("KUBER BOMBER - EXEMPLO DE USO")
     print("="*60)
     print()
     
+    # A verificação do cluster local roda enquanto o usuário escolhe o
+    # contexto, escondendo a latência do kubectl atrás do prompt
+    cluster_probe = _start_cluster_probe()
+    
     # Detectar contexto de execução
     use_aws = False
     print("🔍 CONFIGURAÇÃO DO AMBIENTE")
     print("-" * 60)
-    print("Em qual contexto você está executando?")
-    print()
-    print("1. Cluster Local (minikube, kind, k3s, etc.)")
-    print("2. AWS EKS (cluster na nuvem)")
-    print()
+    if args.mode is None:
+        print("Em qual contexto você está executando?")
+        print()
+        print("1. Cluster Local (minikube, kind, k3s, etc.)")
+        print("2. AWS EKS (cluster na nuvem)")
+        print()
     
     while True:
         try:
-            modo = input("Escolha o contexto (1 ou 2): ").strip()
+            if args.mode is None:
+                modo = input("Escolha o contexto (1 ou 2): ").strip()
+            else:
+                modo = '2' if args.mode == 'aws' else '1'
             if modo == '1':
                 use_aws = False
                 print("✅ Contexto configurado: Cluster Local")
@@ -598,6 +848,7 @@ def main():
                 print("❌ Opção inválida. Digite 1 ou 2.")
         except KeyboardInterrupt:
             print("\n❌ Interrompido pelo usuário")
+            _stop_cluster_probe(cluster_probe)
             return
         except:
             print("❌ Erro na entrada. Digite 1 ou 2.")
@@ -605,84 +856,93 @@ def main():
     print()
     
     # Criar exemplo
-    exemplo = ExemploUso(use_aws=use_aws)
+    exemplo = ExemploUso(use_aws=use_aws, assume_yes=args.yes)
     
     # Verificar conectividade do contexto escolhido
     print("🔍 Verificando conectividade...")
     if use_aws:
+        _stop_cluster_probe(cluster_probe)
         # Verificar se aws_config.json existe
-        config_path = os.path.join(
-            os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-            "configs",
-            "aws_config.json"
-        )
-        if not os.path.exists(config_path):
+        config_path = _AWS_CONFIG_FILE
+        try:
+            os.stat(config_path)
+        except FileNotFoundError:
             print(f"❌ ERRO: aws_config.json não encontrado em {config_path}")
             print("   Configure o arquivo e tente novamente.")
             return
         print("✅ aws_config.json encontrado")
     else:
-        # Verificar se kubectl está funcionando
-        import subprocess
+        # Verificar se kubectl está funcionando (resultado da verificação já iniciada)
         try:
-            result = subprocess.run(['kubectl', 'cluster-info'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
+            if isinstance(cluster_probe, Exception):
+                raise cluster_probe
+            try:
+                returncode = cluster_probe.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                _stop_cluster_probe(cluster_probe)
+                raise
+            if returncode == 0:
                 print("✅ Cluster local conectado")
             else:
                 print("⚠️ ATENÇÃO: Problema de conectividade com cluster local")
                 print("   Certifique-se de que o cluster está rodando (minikube start, kind create cluster, etc.)")
-                continuar = input("Continuar mesmo assim? (s/N): ").lower().strip()
-                if continuar not in ['s', 'sim', 'y', 'yes']:
+                if not _confirm("Continuar mesmo assim? (s/N): ", args.yes):
                     print("Operação cancelada.")
                     return
         except Exception as e:
             print("⚠️ ATENÇÃO: Não foi possível verificar conectividade do cluster")
             print(f"   Erro: {e}")
-            continuar = input("Continuar mesmo assim? (s/N): ").lower().strip()
-            if continuar not in ['s', 'sim', 'y', 'yes']:
+            if not _confirm("Continuar mesmo assim? (s/N): ", args.yes):
                 print("Operação cancelada.")
                 return
     
-    # Menu de operações
+    # Opções do menu -> ação correspondente (0 encerra)
+    acoes = {
+        '1': lambda: exemplo.get_config(run_mttr_analysis=False),
+        '2': exemplo.check_availability,
+        '3': lambda: exemplo.get_config(run_mttr_analysis=True, parallel_mttr=args.mttr_parallelism),
+        '4': exemplo.check_pods_health,
+        '5': exemplo.test_recovery_methods,
+        '6': exemplo.executar_fluxo_completo,
+    }
+    
+    # Menu de operações (--menu executa uma única opção sem interação)
     while True:
-        print("\n" + "="*60)
-        print("MENU PRINCIPAL")
-        print("="*60)
-        print("1. Get_Config")
-        print("2. Teste de disponibilidade")
-        print("3. get_config_all")
-        print("4. Verificar saúde dos pods (Running + Curl)")
-        print("5. Testar métodos de recuperação")
-        print("6. Executar fluxo completo (recomendado)")
-        print("0. Sair")
-        print()
+        if args.menu is None:
+            print("\n" + "="*60)
+            print("MENU PRINCIPAL")
+            print("="*60)
+            print("1. Get_Config")
+            print("2. Teste de disponibilidade")
+            print("3. get_config_all")
+            print("4. Verificar saúde dos pods (Running + Curl)")
+            print("5. Testar métodos de recuperação")
+            print("6. Executar fluxo completo (recomendado)")
+            print("0. Sair")
+            print()
         
         try:
-            opcao = input("Escolha uma opção: ").strip()
-            
-            if opcao == '1':
-                exemplo.get_config(run_mttr_analysis=False)
-            elif opcao == '2':
-                exemplo.check_availability()
-            elif opcao == '3':
-                exemplo.get_config(run_mttr_analysis=True)
-            elif opcao == '4':
-                exemplo.check_pods_health()
-            elif opcao == '5':
-                exemplo.test_recovery_methods()
-            elif opcao == '6':
-                exemplo.executar_fluxo_completo()
-            elif opcao == '0':
+            if args.menu is None:
+                opcao = input("Escolha uma opção: ").strip()
+            else:
+                opcao = str(args.menu)
+            
+            if opcao == '0':
                 print("\n✅ Até logo!")
                 break
-            else:
+            acao = acoes.get(opcao)
+            if acao is None:
                 print("❌ Opção inválida")
+            else:
+                acao()
         except KeyboardInterrupt:
             print("\n❌ Interrompido pelo usuário")
             break
         except Exception as e:
             print(f"❌ Erro: {e}")
+        
+        if args.menu is not None:
+            break
 
 
 if __name__ == "__main__":
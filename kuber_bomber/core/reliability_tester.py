@@ -5,10 +5,11 @@ Classe principal que coordena testes de MTTF (Mean Time To Failure)
 e MTTR (Mean Time To Recovery) em diferentes componentes com CSV em tempo real.
 """
 
+import os
 import time
 import sys
+import logging
 import threading
-import statistics
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -23,6 +24,18 @@ from ..utils.interactive_selector import InteractiveSelector
 from ..utils.config import get_config
 from ..utils.kubectl_executor import KubectlExecutor
 
+logger = logging.getLogger(__name__)
+
+# Uma linha por pod: "nome|fase|ready,ready,..." (lida com um único split)
+_POD_STATUS_JSONPATH = (
+    '{range .items[*]}{.metadata.name}|{.status.phase}|'
+    '{range .status.containerStatuses[*]}{.ready},{end}{"\\n"}{end}'
+)
+# Separador dos cabeçalhos de iteração
+_BANNER = '=' * 60
+_FAILED_PHASES = frozenset({'CrashLoopBackOff', 'Error', 'Failed'})
+_PENDING_PHASES = frozenset({'Pending', 'ContainerCreating'})
+
 
 class ReliabilityTester:
     """
@@ -35,6 +48,55 @@ class ReliabilityTester:
     medir a confiabilidade de diferentes componentes do sistema.
     """
     
+    # Métodos de falha: (nome, dono, atributo). "self" aponta para os wrappers
+    # que passam o delay configurado; os demais donos são os injetores.
+    _AWS_FAILURE_METHODS = (
+        # === POD FAILURES ===
+        ('kill_processes', 'aws', 'kill_all_processes'),
+        ('kill_init', 'aws', 'kill_init_process'),
+        
+        # === WORKER NODE FAILURES ===
+        # ('kill_worker_node_processes', 'aws', 'kill_worker_node_processes'),
+        ('shutdown_worker_node', 'self', '_shutdown_worker_node_wrapper'),
+        ('restart_worker_node', 'aws', 'kill_worker_node_processes'),  # Usa mesmo método
+        ('kill_kubelet', 'aws', 'kill_kubelet'),
+        ('delete_kube_proxy', 'aws', 'kill_kube_proxy_pod'),
+        ('restart_containerd', 'aws', 'restart_containerd'),
+        
+        # === CONTROL PLANE FAILURES ===
+        ('kill_control_plane_processes', 'aws', 'kill_control_plane_processes'),
+        ('shutdown_control_plane', 'self', '_shutdown_control_plane_wrapper'),
+        ('kill_kube_apiserver', 'aws', 'kill_kube_apiserver'),
+        ('kill_kube_controller_manager', 'aws', 'kill_kube_controller_manager'),
+        ('kill_kube_scheduler', 'aws', 'kill_kube_scheduler'),
+        ('kill_etcd', 'aws', 'kill_etcd'),
+    )
+    
+    _LOCAL_FAILURE_METHODS = (
+        # === POD FAILURES ===
+        ('kill_processes', 'pod', 'kill_all_processes'),
+        ('kill_init', 'pod', 'kill_init_process'),
+        # ('delete_pod', 'pod', 'delete_pod'),
+        
+        # === WORKER NODE FAILURES ===
+        ('kill_worker_node_processes', 'node', 'kill_worker_node_processes'),
+        ('restart_worker_node', 'node', 'kill_worker_node_processes'),  # Mesmo que kill (docker restart)
+        ('kill_kubelet', 'control_plane', 'kill_kubelet'),
+        ('shutdown_worker_node', 'self', '_shutdown_worker_node_wrapper'),
+        
+        # === CONTROL PLANE FAILURES ===
+        ('kill_control_plane_processes', 'node', 'kill_control_plane_processes'),
+        ('shutdown_control_plane', 'self', '_shutdown_control_plane_wrapper'),
+        ('kill_kube_apiserver', 'control_plane', 'kill_kube_apiserver'),
+        ('kill_kube_controller_manager', 'control_plane', 'kill_kube_controller_manager'),
+        ('kill_kube_scheduler', 'control_plane', 'kill_kube_scheduler'),
+        ('kill_etcd', 'control_plane', 'kill_etcd'),
+        
+        # === NETWORK/RUNTIME FAILURES ===
+        ('delete_kube_proxy', 'control_plane', 'delete_kube_proxy_pod'),
+        ('restart_containerd', 'control_plane', 'restart_containerd'),
+    )
+    
     def __init__(self, time_acceleration: float = 1.0, base_mttf_hours: float = 1.0, aws_config: Optional[Dict] = None):
         """
         Inicializa o testador de confiabilidade.
@@ -52,14 +114,15 @@ class ReliabilityTester:
         self.kubectl = KubectlExecutor(aws_config=aws_config if self.is_aws_mode else None)
         
         # Componentes do framework - PASSANDO aws_config para detecção correta de contexto
-        if self.is_aws_mode:
-            self.config = get_config(aws_mode=True, aws_config=aws_config)
-        else:
-            self.config = get_config(aws_mode=False)
-        
-        # Obter config com AWS mode PRIMEIRO
         self.config = get_config(aws_mode=self.is_aws_mode, aws_config=aws_config)
         
+        # Delay dos wrappers de shutdown (campo "delay" do config_simples, padrão 10s).
+        # Os handlers ainda releem config_simples, então mudanças posteriores valem.
+        config_simples = getattr(self.config, 'config_simples', None)
+        if not isinstance(config_simples, dict):
+            config_simples = {}
+        self._shutdown_delay = config_simples.get('delay', 10)
+        
         # Inicializar componentes com configuração AWS se disponível
         if self.is_aws_mode:
             self.health_checker = HealthChecker(aws_config=aws_config)
@@ -100,59 +163,31 @@ class ReliabilityTester:
         # Estado do teste
         self.test_results = []
         
+        # Node do ControlPlane usado em _show_quick_pod_status (modo AWS)
+        self._cp_node_cache = None
+        
+        # Cliente Kubernetes do modo local (criado na primeira consulta; False = indisponível)
+        self._k8s_core_api = None
+        self._k8s_namespace = 'default'
+        
         # Controle de threading para simulação contínua
         self.simulation_running = False
         self.simulation_thread = None
         self.stop_simulation_event = threading.Event()
         
         # Mapeamento de métodos de falha - TODOS da tabela
-        if self.is_aws_mode and hasattr(self, 'aws_injector') and self.aws_injector:
-            self.failure_methods = {
-                # === POD FAILURES ===
-                'kill_processes': self.aws_injector.kill_all_processes,
-                'kill_init': self.aws_injector.kill_init_process,
-                
-                # === WORKER NODE FAILURES ===
-                # 'kill_worker_node_processes': self.aws_injector.kill_worker_node_processes,
-                'shutdown_worker_node': self._shutdown_worker_node_wrapper,  # Wrapper para passar delay configurado
-                'restart_worker_node': self.aws_injector.kill_worker_node_processes,  # Usa mesmo método 
-                'kill_kubelet': self.aws_injector.kill_kubelet,
-                'delete_kube_proxy': self.aws_injector.kill_kube_proxy_pod,
-                'restart_containerd': self.aws_injector.restart_containerd,
-                
-                # === CONTROL PLANE FAILURES ===
-                'kill_control_plane_processes': self.aws_injector.kill_control_plane_processes,
-                'shutdown_control_plane': self._shutdown_control_plane_wrapper,  # Wrapper para passar delay configurado
-                'kill_kube_apiserver': self.aws_injector.kill_kube_apiserver,
-                'kill_kube_controller_manager': self.aws_injector.kill_kube_controller_manager,
-                'kill_kube_scheduler': self.aws_injector.kill_kube_scheduler,
-                'kill_etcd': self.aws_injector.kill_etcd,
-            }
+        if hasattr(self, 'aws_injector'):
+            owners = {'aws': self.aws_injector, 'self': self}
+            table = self._AWS_FAILURE_METHODS
         else:
-            self.failure_methods = {
-                # === POD FAILURES ===
-                'kill_processes': self.pod_injector.kill_all_processes,
-                'kill_init': self.pod_injector.kill_init_process,
-                # 'delete_pod': self.pod_injector.delete_pod,
-                
-                # === WORKER NODE FAILURES ===
-                'kill_worker_node_processes': self.node_injector.kill_worker_node_processes,
-                'restart_worker_node': self.node_injector.kill_worker_node_processes,  # Mesmo que kill (docker restart)
-                'kill_kubelet': self.control_plane_injector.kill_kubelet,
-                'shutdown_worker_node': self._shutdown_worker_node_wrapper,  # Wrapper para passar delay configurado
-                
-                # === CONTROL PLANE FAILURES ===
-                'kill_control_plane_processes': self.node_injector.kill_control_plane_processes,
-                'shutdown_control_plane': self._shutdown_control_plane_wrapper,  # Wrapper para passar delay configurado
-                'kill_kube_apiserver': self.control_plane_injector.kill_kube_apiserver,
-                'kill_kube_controller_manager': self.control_plane_injector.kill_kube_controller_manager,
-                'kill_kube_scheduler': self.control_plane_injector.kill_kube_scheduler,
-                'kill_etcd': self.control_plane_injector.kill_etcd,
-                
-                # === NETWORK/RUNTIME FAILURES ===
-                'delete_kube_proxy': self.control_plane_injector.delete_kube_proxy_pod,
-                'restart_containerd': self.control_plane_injector.restart_containerd
+            owners = {
+                'pod': self.pod_injector,
+                'node': self.node_injector,
+                'control_plane': self.control_plane_injector,
+                'self': self,
             }
+            table = self._LOCAL_FAILURE_METHODS
+        self.failure_methods = {name: getattr(owners[owner], attr) for name, owner, attr in table}
     
     def initial_system_check(self) -> Tuple[int, Dict, List[str]]:
         """
@@ -194,34 +229,16 @@ class ReliabilityTester:
     
     def _shutdown_worker_node_wrapper(self, target: str) -> Tuple[bool, str]:
         """
-        Wrapper para shutdown_worker_node que obtém delay da configuração.
+        Wrapper para shutdown_worker_node que passa o delay da configuração.
         """
-        # Obter delay da configuração
-        delay_seconds = 10  # Default
-        
-        if hasattr(self, 'config') and self.config:
-            config_simples = getattr(self.config, 'config_simples', None)
-            if config_simples and isinstance(config_simples, dict):
-                delay_seconds = config_simples.get('delay', delay_seconds)
-        
-        # Chamar o handler real com delay configurado
-        return self._shutdown_worker_node_handler(target, delay_seconds)
+        return self._shutdown_worker_node_handler(target, self._shutdown_delay)
     
     def _shutdown_control_plane_wrapper(self, target: str) -> Tuple[bool, str]:
         """
-        Wrapper para shutdown_control_plane que obtém delay da configuração.
+        Wrapper para shutdown_control_plane que passa o delay da configuração.
         Segue a mesma lógica do shutdown_worker_node.
         """
-        # Obter delay da configuração
-        delay_seconds = 10  # Default
-        
-        if hasattr(self, 'config') and self.config:
-            config_simples = getattr(self.config, 'config_simples', None)
-            if config_simples and isinstance(config_simples, dict):
-                delay_seconds = config_simples.get('delay', delay_seconds)
-        
-        # Chamar o handler real com delay configurado
-        return self._shutdown_control_plane_handler(target, delay_seconds)
+        return self._shutdown_control_plane_handler(target, self._shutdown_delay)
     
     def run_reliability_test(self, component_type: str, failure_method: str, 
                            target: Optional[str] = None, iterations: int = 30, 
@@ -242,17 +259,17 @@ class ReliabilityTester:
         Returns:
             Lista com resultados de cada iteração
         """
-        print(f"\n🧪 === TESTE DE CONFIABILIDADE COM CSV EM TEMPO REAL ===")
-        print(f"📊 Componente: {component_type}")
-        print(f"🔨 Método de falha: {failure_method}")
-        print(f"🔢 Iterações: {iterations}")
-        print(f"⏱️ Intervalo: {interval}s")
-        print(f"⏰ Timeout de recuperação: {self.config.current_recovery_timeout}s")
-        print("="*60)
+        logger.info("\n🧪 === TESTE DE CONFIABILIDADE COM CSV EM TEMPO REAL ===")
+        logger.info("📊 Componente: %s", component_type)
+        logger.info("🔨 Método de falha: %s", failure_method)
+        logger.info("🔢 Iterações: %s", iterations)
+        logger.info("⏱️ Intervalo: %ss", interval)
+        logger.info("⏰ Timeout de recuperação: %ss", self.config.current_recovery_timeout)
+        logger.info("="*60)
         
         # Verificar se o método de falha existe
         if failure_method not in self.failure_methods:
-            print(f"❌ Método de falha '{failure_method}' não encontrado")
+            logger.error("❌ Método de falha '%s' não encontrado", failure_method)
             return []
         
         # Selecionar alvo se não especificado
@@ -260,15 +277,15 @@ class ReliabilityTester:
             target = self._select_target(component_type)
         
         if not target:
-            print("❌ Nenhum alvo selecionado")
+            logger.error("❌ Nenhum alvo selecionado")
             return []
         
-        print(f"🎯 Alvo selecionado: {target}")
+        logger.info("🎯 Alvo selecionado: %s", target)
         
         # ⭐ INICIAR CSV EM TEMPO REAL ⭐
         csv_file = self.csv_reporter.start_realtime_report(component_type, failure_method, target)
         if not csv_file:
-            print("⚠️ Erro ao iniciar CSV em tempo real, continuando sem ele")
+            logger.warning("⚠️ Erro ao iniciar CSV em tempo real, continuando sem ele")
         
         # Verificação inicial completa do sistema
         healthy_count, initial_health, discovered_apps = self.initial_system_check()
@@ -279,23 +296,23 @@ class ReliabilityTester:
         if healthy_count == 0:
             # Em modo AWS, pular validação de aplicações (testamos infraestrutura)
             if self.is_aws_mode:
-                print("⚠️ Modo AWS: Pulando validação de aplicações para testes de infraestrutura")
-                print("🚀 Continuando com teste mesmo com aplicações não saudáveis...")
+                logger.warning("⚠️ Modo AWS: Pulando validação de aplicações para testes de infraestrutura")
+                logger.info("🚀 Continuando com teste mesmo com aplicações não saudáveis...")
             elif not self._handle_unhealthy_system():
                 self.csv_reporter.finish_realtime_report()
                 return []
         
         # Executar teste iterativo
         results = []
-        test_start_time = time.time()
+        test_start_time = time.monotonic()
         
         try:
             for iteration in range(1, iterations + 1):
-                print(f"\n🔄 === ITERAÇÃO {iteration}/{iterations} ===")
+                logger.info("\n🔄 === ITERAÇÃO %s/%s ===", iteration, iterations)
                 
                 # Executar uma iteração de teste
                 if self.is_aws_mode:
-                    print("🚀 Modo AWS: Usando verificação de pods via control plane...")
+                    logger.info("🚀 Modo AWS: Usando verificação de pods via control plane...")
                     
                     # Mostrar pods atuais das aplicações
                     # all_pods = self.system_monitor.get_pods()
@@ -328,21 +345,24 @@ class ReliabilityTester:
                 
                 # Aguardar intervalo antes da próxima iteração (exceto na última)
                 if iteration < iterations:
-                    print(f"⏸️ Aguardando {interval}s antes da próxima iteração...")
+                    logger.info("⏸️ Aguardando %ss antes da próxima iteração...", interval)
                     
-                    # Mostrar progresso durante a espera
-                    for remaining in range(interval, 0, -1):
-                        if remaining <= 10 or remaining % 10 == 0:
-                            print(f"⏳ {remaining}s restantes...")
-                        time.sleep(1)
+                    if self._wait_interval(interval):
+                        logger.info("\n⏹️ Teste interrompido (stop_simulation_event)")
+                        break
         
         except KeyboardInterrupt:
-            print("\n⚠️ Teste interrompido pelo usuário")
+            logger.warning("\n⚠️ Teste interrompido pelo usuário")
         
         finally:
+            # Garantir as iterações do lote no CSV antes de qualquer outro passo
+            # (interrupção, parada ou erro durante o processamento final)
+            self.csv_reporter.flush_realtime_report()
+            
             # Calcular estatísticas finais
-            total_test_time = time.time() - test_start_time
-            self._process_final_results(results, component_type, failure_method, target, total_test_time)
+            total_test_time = time.monotonic() - test_start_time
+            self._process_final_results(results, component_type, failure_method, target, total_test_time,
+                                        end_time=datetime.now())
             
             # ⭐ FINALIZAR CSV EM TEMPO REAL ⭐
             if self.csv_reporter.is_realtime_active():
@@ -351,22 +371,48 @@ class ReliabilityTester:
         
         return results
     
+    def _wait_interval(self, interval: int) -> bool:
+        """
+        Aguarda o intervalo entre iterações mostrando o progresso.
+        
+        Dorme direto até cada marca exibida (a cada 10s e nos últimos 10s)
+        em vez de acordar a cada segundo, e retorna assim que
+        stop_simulation_event for sinalizado.
+        
+        Returns:
+            True se a espera foi interrompida pelo evento de parada
+        """
+        marks = sorted({*range(1, min(interval, 10) + 1), *range(10, interval + 1, 10)}, reverse=True)
+        previous = interval
+        for remaining in marks:
+            if self.stop_simulation_event.wait(previous - remaining):
+                return True
+            logger.info("⏳ %ss restantes...", remaining)
+            previous = remaining
+        return self.stop_simulation_event.wait(previous)
+    
     def _calculate_summary_stats(self, results: List[Dict], component_type: str, 
                                failure_method: str, target: str, total_test_time: float) -> Dict:
         """Calcula estatísticas de resumo para o CSV."""
         if not results:
             return {}
         
-        recovery_times = [r['recovery_time_seconds'] for r in results if r['recovered']]
-        success_rate = len(recovery_times) / len(results) * 100 if results else 0
-        average_mttr = statistics.mean(recovery_times) if recovery_times else 0
+        # Contagem e soma numa única passada, sem lista intermediária
+        recovered_count = 0
+        total_recovery = 0.0
+        for r in results:
+            if r['recovered']:
+                recovered_count += 1
+                total_recovery += r['recovery_time_seconds']
+        success_rate = recovered_count / len(results) * 100
+        average_mttr = total_recovery / recovered_count if recovered_count else 0
         
         return {
             'component_type': component_type,
             'failure_method': failure_method,
             'target': target,
             'total_iterations': len(results),
-            'successful_recoveries': len(recovery_times),
+            'successful_recoveries': recovered_count,
             'success_rate': success_rate,
             'average_mttr': average_mttr,
             'total_test_time': total_test_time
@@ -377,13 +423,13 @@ class ReliabilityTester:
         if component_type == 'pod':
             pods = self.system_monitor.get_pods()
             if not pods:
-                print("❌ Nenhum pod encontrado")
+                logger.error("❌ Nenhum pod encontrado")
                 return None
             return self.interactive_selector.select_from_list(pods, f"Selecione o pod para testar")
         elif component_type == 'worker_node':
             nodes = self.system_monitor.get_worker_nodes()
             if not nodes:
-                print("❌ Nenhum worker node encontrado")
+                logger.error("❌ Nenhum worker node encontrado")
                 return None
             return self.interactive_selector.select_from_list(nodes, f"Selecione o worker node para testar")
         elif component_type == 'control_plane':
@@ -392,7 +438,14 @@ class ReliabilityTester:
         return None
     
     def _handle_unhealthy_system(self) -> bool:
-        """Lida com sistema não saudável."""
+        """
+        Lida com sistema não saudável.
+        
+        A resposta é lida do stdin, inclusive quando vem de um pipe (o
+        MTTRAnalyzer responde "y" assim). Com KUBER_BOMBER_NONINTERACTIVE=1, ou
+        se o stdin já estiver em EOF, não há pergunta: vale a política de
+        KUBER_BOMBER_ON_UNHEALTHY ("continue" ou "abort", padrão "abort").
+        """
         print("⚠️ NENHUMA APLICAÇÃO ESTÁ SAUDÁVEL!")
         print("💡 Possíveis soluções:")
         print("   1. Verifique se os pods estão rodando: kubectl get pods")
@@ -405,69 +458,82 @@ class ReliabilityTester:
         else:
             print("   2. Verifique se as aplicações estão acessíveis via IP público")
             print("   3. Verifique se os serviços LoadBalancer estão configurados")
+        
+        if os.environ.get('KUBER_BOMBER_NONINTERACTIVE') == '1':
+            return self._unhealthy_policy()
+        
         print("\n🔧 Deseja continuar mesmo assim? (y/N):")
         
         try:
             choice = input().strip().lower()
             return choice in ['y', 'yes', 's', 'sim']
+        except EOFError:
+            # Sem resposta disponível (stdin fechado): não bloquear
+            return self._unhealthy_policy()
         except KeyboardInterrupt:
             print("\n❌ Teste cancelado")
             return False
     
+    @staticmethod
+    def _unhealthy_policy() -> bool:
+        """Decisão não interativa para sistema não saudável (KUBER_BOMBER_ON_UNHEALTHY)."""
+        proceed = os.environ.get('KUBER_BOMBER_ON_UNHEALTHY', 'abort') == 'continue'
+        print(f"🤖 Execução não interativa: {'continuando' if proceed else 'abortando'} "
+              f"(KUBER_BOMBER_ON_UNHEALTHY)")
+        return proceed
+    
     def _execute_test_iteration(self, iteration: int, component_type: str, 
                               failure_method: str, target: str) -> Optional[Dict]:
         """Executa uma iteração individual de teste."""
         
         # ========== CABEÇALHO DA ITERAÇÃO ==========
-        print(f"\n{'='*60}")
-        print(f"🎯 ITERAÇÃO {iteration} - {component_type.upper()}: {failure_method}")
-        print(f"🎭 Target: {target}")
-        print(f"{'='*60}")
+        logger.info("\n%s\n🎯 ITERAÇÃO %d - %s: %s\n🎭 Target: %s\n%s",
+                    _BANNER, iteration, component_type.upper(), failure_method, target, _BANNER)
         
-        iteration_start = time.time()
+        iteration_start = time.monotonic()
         
         # ========== STATUS INICIAL CONCISO ==========
-        print(f"\n📋 STATUS INICIAL:")
+        logger.info("\n📋 STATUS INICIAL:")
         self._show_quick_pod_status()
         
         # ========== INJEÇÃO DE FALHA ==========
-        print(f"\n🔴 INJETANDO FALHA: {failure_method}")
-        print(f"🎯 Alvo: {target}")
+        logger.info("\n🔴 INJETANDO FALHA: %s", failure_method)
+        logger.info("🎯 Alvo: %s", target)
         
-        failure_start = time.time()
+        failure_start = time.monotonic()
         failure_timestamp = datetime.now().isoformat()
         
         failure_success, executed_command = self.failure_methods[failure_method](target)
         
         if not failure_success:
-            print(f"❌ FALHA na injeção de falha para {target}")
+            logger.error("❌ FALHA na injeção de falha para %s", target)
             return None
         
-        injection_time = time.time() - failure_start
-        print(f"✅ FALHA INJETADA com sucesso em {injection_time:.2f}s!")
+        injection_time = time.monotonic() - failure_start
+        logger.info("✅ FALHA INJETADA com sucesso em %.2fs!", injection_time)
         
         # ========== AGUARDANDO RECUPERAÇÃO ==========
-        print(f"\n⏳ AGUARDANDO RECUPERAÇÃO...")
-        recovery_start = time.time()
+        logger.info("\n⏳ AGUARDANDO RECUPERAÇÃO...")
+        recovery_start = time.monotonic()
         
         # Usar método combinado silencioso para verificação mais rápida
-        print(f"🔍 Verificando recuperação com método combinado (running + curl)...")
+        logger.info("🔍 Verificando recuperação com método combinado (running + curl)...")
         recovered, recovery_time = self.health_checker.wait_for_pods_recovery_combined_silent()
         
         # ========== RESULTADO ==========
-        total_time = time.time() - iteration_start
+        total_time = time.monotonic() - iteration_start
         
         if recovered:
-            print(f"\n🎉 SUCESSO - Iteração {iteration} completada!")
-            print(f"⏱️ Tempo de recuperação: {recovery_time:.2f}s")
-            print(f"🕐 Tempo total: {total_time:.2f}s")
+            logger.info("\n🎉 SUCESSO - Iteração %s completada!", iteration)
+            logger.info("⏱️ Tempo de recuperação: %.2fs", recovery_time)
+            logger.info("🕐 Tempo total: %.2fs", total_time)
         else:
-            print(f"\n❌ FALHA - Iteração {iteration} não recuperou")
-            print(f"⏰ Timeout após {recovery_time:.2f}s")
-            print(f"🕐 Tempo total: {total_time:.2f}s")
+            logger.error("\n❌ FALHA - Iteração %s não recuperou", iteration)
+            logger.info("⏰ Timeout após %.2fs", recovery_time)
+            logger.info("🕐 Tempo total: %.2fs", total_time)
         
         # ========== STATUS FINAL CONCISO ==========
-        print(f"\n📊 STATUS FINAL:")
+        logger.info("\n📊 STATUS FINAL:")
         self._show_quick_pod_status()
         
         # Atualizar métricas
@@ -491,101 +557,139 @@ class ReliabilityTester:
         
         return result
     
+    def _get_k8s_core_api(self):
+        """
+        Retorna um CoreV1Api do pacote kubernetes, criado uma única vez.
+        
+        O cliente mantém a conexão HTTPS com o API server entre chamadas,
+        evitando um fork de kubectl (e um novo handshake TLS) a cada consulta.
+        
+        Returns:
+            CoreV1Api ou None se o pacote não estiver instalado ou o kubeconfig
+            não puder ser carregado (nesse caso usa-se kubectl)
+        """
+        if self._k8s_core_api is None:
+            self._k8s_core_api = False
+            try:
+                from kubernetes import client, config as k8s_config
+                k8s_config.load_kube_config()
+                _, active_context = k8s_config.list_kube_config_contexts()
+                self._k8s_namespace = active_context['context'].get('namespace', 'default')
+                self._k8s_core_api = client.CoreV1Api()
+            except Exception:
+                pass
+        return self._k8s_core_api or None
+    
+    @staticmethod
+    def _pod_status_emoji(pod_phase: str, ready: bool) -> str:
+        """Emoji do status de um pod (fase + todos os containers prontos)."""
+        if pod_phase == 'Running' and ready:
+            return "✅"
+        if pod_phase in _FAILED_PHASES:
+            return "❌"
+        if pod_phase in _PENDING_PHASES:
+            return "🔄"
+        return "❓"
+    
+    def _print_pod_status_lines(self, output: str, app_pods_only: bool = False):
+        """
+        Imprime o status dos pods a partir da saída de _POD_STATUS_JSONPATH.
+        
+        Cada linha tem o formato "nome|fase|true,false," e é quebrada uma
+        única vez; o pod só conta como pronto se TODOS os containers estiverem.
+        """
+        for line in output.splitlines():
+            parts = line.split('|', 2)
+            if len(parts) < 3:
+                continue
+            pod_name, pod_phase, ready_str = parts
+            # Mostrar apenas pods das aplicações (que contêm -app-)
+            if app_pods_only and '-app-' not in pod_name:
+                continue
+            ready_flags = ready_str.rstrip(',')
+            ready = bool(ready_flags) and all(flag == 'true' for flag in ready_flags.split(','))
+            emoji = self._pod_status_emoji(pod_phase, ready)
+            logger.info("   %s %s: %s (%s)", emoji, pod_name, pod_phase, ready_flags or '<none>')
+    
     def _show_quick_pod_status(self):
         """Mostra status conciso dos pods principais."""
         try:
             if self.is_aws_mode:
-                # AWS: Usar kubectl via SSH
-                instances = self.aws_injector._get_aws_instances()
-            
-                # Encontrar o node_name do ControlPlane dentro do dicionário instances
-                control_plane_node = next(
-                    (k for k, v in instances.items() if v.get('Name') == 'ControlPlane' or v.get('Name', '').lower().startswith('control')),
-                    None
-                )
+                # AWS: Usar kubectl via SSH no node do ControlPlane, descoberto
+                # uma vez e reaproveitado até um shutdown do control plane
+                if self._cp_node_cache is None:
+                    instances = self.aws_injector._get_aws_instances()
+                    self._cp_node_cache = next(
+                        (k for k, v in instances.items() if v.get('Name') == 'ControlPlane' or v.get('Name', '').lower().startswith('control')),
+                        None
+                    )
+                control_plane_node = self._cp_node_cache
                 if not control_plane_node:
-                    print("   ❌ ControlPlane não encontrado em instances")
+                    logger.error("   ❌ ControlPlane não encontrado em instances")
                     return False
 
                 node_name = control_plane_node  # Ex.: 'ip-10-0-0-28'
                 
                 result = self.aws_injector._execute_ssh_command(
                     node_name,
-                    'sudo kubectl get pods --no-headers -o custom-columns=NAME:.metadata.name,STATUS:.status.phase,READY:.status.containerStatuses[*].ready'
+                    f"sudo kubectl get pods -o jsonpath='{_POD_STATUS_JSONPATH}'"
                 )
                 
                 if result[0] and result[1].strip():
-                    lines = result[1].strip().split('\n')
-                    for line in lines:
-                        if line.strip():
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                pod_name = parts[0]
-                                pod_phase = parts[1]
-                                ready_status = parts[2] if len(parts) > 2 else "unknown"
-                                
-                                # Emojis baseados no status
-                                if pod_phase == 'Running' and 'true' in ready_status:
-                                    emoji = "✅"
-                                elif pod_phase in ['CrashLoopBackOff', 'Error', 'Failed']:
-                                    emoji = "❌"
-                                elif pod_phase in ['Pending', 'ContainerCreating']:
-                                    emoji = "🔄"
-                                else:
-                                    emoji = "❓"
-                                
-                                # Mostrar apenas pods das aplicações (que contêm -app-)
-                                if '-app-' in pod_name:
-                                    print(f"   {emoji} {pod_name}: {pod_phase} ({ready_status})")
+                    self._print_pod_status_lines(result[1], app_pods_only=True)
                 else:
-                    print("   ❌ Erro ao verificar pods via SSH")
+                    logger.error("   ❌ Erro ao verificar pods via SSH")
             else:
-                # Local: kubectl direto
+                # Local: cliente Python do Kubernetes (conexão reaproveitada),
+                # ou kubectl direto se o pacote não estiver instalado ou a
+                # chamada à API falhar
+                core_api = self._get_k8s_core_api()
+                pods = None
+                if core_api is not None:
+                    try:
+                        pods = core_api.list_namespaced_pod(self._k8s_namespace, _request_timeout=10).items
+                    except Exception as e:
+                        logger.debug("Falha na API do Kubernetes, usando kubectl: %s", e)
+                if pods is not None:
+                    for pod in pods:
+                        ready_flags = [cs.ready for cs in pod.status.container_statuses or []]
+                        ready_status = ','.join(str(flag).lower() for flag in ready_flags) or '<none>'
+                        emoji = self._pod_status_emoji(pod.status.phase, bool(ready_flags) and all(ready_flags))
+                        logger.info("   %s %s: %s (%s)", emoji, pod.metadata.name, pod.status.phase, ready_status)
+                    return
+                
                 import subprocess
                 result = subprocess.run(
-                    ['kubectl', 'get', 'pods', '--no-headers', 
-                     '-o', 'custom-columns=NAME:.metadata.name,STATUS:.status.phase,READY:.status.containerStatuses[*].ready'],
+                    ['kubectl', 'get', 'pods', '-o', f'jsonpath={_POD_STATUS_JSONPATH}'],
                     capture_output=True, text=True, timeout=10
                 )
                 
                 if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
-                        if line.strip():
-                            parts = line.split()
-                            if len(parts) >= 3:
-                                pod_name = parts[0]
-                                pod_phase = parts[1]
-                                ready_status = parts[2] if len(parts) > 2 else "unknown"
-                                
-                                if pod_phase == 'Running' and 'true' in ready_status:
-                                    emoji = "✅"
-                                elif pod_phase in ['CrashLoopBackOff', 'Error', 'Failed']:
-                                    emoji = "❌"
-                                elif pod_phase in ['Pending', 'ContainerCreating']:
-                                    emoji = "🔄"
-                                else:
-                                    emoji = "❓"
-                                
-                                print(f"   {emoji} {pod_name}: {pod_phase} ({ready_status})")
+                    self._print_pod_status_lines(result.stdout)
                 else:
-                    print("   ❌ Erro ao verificar pods localmente")
+                    logger.error("   ❌ Erro ao verificar pods localmente")
                     
         except Exception as e:
-            print(f"   ⚠️ Erro ao verificar status dos pods: {e}")
+            logger.warning("   ⚠️ Erro ao verificar status dos pods: %s", e)
     
     def _print_iteration_result(self, result: Dict, iteration: int):
         """Imprime resultado de uma iteração."""
-        print(f"📋 Resultado Iteração {iteration}:")
-        print(f"   ⏱️ MTTR: {result['recovery_time_seconds']:.2f}s")
-        print(f"   ✅ Recuperou: {'Sim' if result['recovered'] else 'Não'}")
-        print(f"   📊 Apps saudáveis antes: {result['initial_healthy_apps']}")
+        logger.info("📋 Resultado Iteração %s:", iteration)
+        logger.info("   ⏱️ MTTR: %.2fs", result['recovery_time_seconds'])
+        logger.info("   ✅ Recuperou: %s", 'Sim' if result['recovered'] else 'Não')
+        logger.info("   📊 Apps saudáveis antes: %s", result['initial_healthy_apps'])
         if self.config.services:
-            print(f"   📈 Timeout usado: {self.config.current_recovery_timeout}s")
+            logger.info("   📈 Timeout usado: %ss", self.config.current_recovery_timeout)
     
     def _process_final_results(self, results: List[Dict], component_type: str, 
-                             failure_method: str, target: str, total_test_time: float):
-        """Processa e exibe resultados finais."""
+                             failure_method: str, target: str, total_test_time: float,
+                             end_time: Optional[datetime] = None):
+        """
+        Processa e exibe resultados finais.
+        
+        end_time define o sufixo do CSV de métricas (padrão: agora), o que
+        permite reprocessar um teste com o nome de arquivo original.
+        """
         # Calcular estatísticas finais
         self.metrics_analyzer.calculate_and_print_statistics(results)
         
@@ -594,16 +698,20 @@ class ReliabilityTester:
         
         # Salvar métricas de componentes
         if self.metrics_analyzer.component_metrics:
-            suffix = f"{component_type}_{failure_method}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            self.csv_reporter.save_component_metrics(self.metrics_analyzer.component_metrics, suffix)
+            end_time = end_time or datetime.now()
+            suffix = f"{component_type}_{failure_method}_{end_time.strftime('%Y%m%d_%H%M%S')}"
+            self.csv_reporter.save_component_metrics(
+                self.metrics_analyzer.component_metrics, suffix,
+                get_stats=self.metrics_analyzer.get_component_statistics
+            )
         
         # Imprimir resumo do teste
-        print(f"\n⏱️ === RESUMO DO TESTE ===")
-        print(f"🕐 Tempo total de teste: {total_test_time:.1f}s ({total_test_time/60:.1f}min)")
-        print(f"📊 Timeout configurado: {self.config.current_recovery_timeout}s")
+        logger.info("\n⏱️ === RESUMO DO TESTE ===")
+        logger.info("🕐 Tempo total de teste: %.1fs (%.1fmin)", total_test_time, total_test_time/60)
+        logger.info("📊 Timeout configurado: %ss", self.config.current_recovery_timeout)
         if self.csv_reporter.get_current_file_path():
-            print(f"📁 Arquivo CSV: {self.csv_reporter.get_current_file_path()}")
-        print("="*50)
+            logger.info("📁 Arquivo CSV: %s", self.csv_reporter.get_current_file_path())
+        logger.info("="*50)
     
     def _shutdown_worker_node_handler(self, target: str, delay_seconds: int = 10) -> Tuple[bool, str]:
         """
@@ -805,9 +913,9 @@ class ReliabilityTester:
         import subprocess
         import time
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             try:
                 # Para AWS, usar SSH direto
                 if self.is_aws_mode and hasattr(self, 'aws_injector') and self.aws_injector:
@@ -895,6 +1003,8 @@ class ReliabilityTester:
             
             # 2. Executar shutdown do control plane
             print(f"🔌 Desligando control plane: {target}")
+            # A instância pode voltar com outro nome/IP: redescobrir na próxima consulta
+            self._cp_node_cache = None
             if self.is_aws_mode and hasattr(self, 'aws_injector') and self.aws_injector:
                 shutdown_success, shutdown_command = self.aws_injector.shutdown_control_plane(target)
             else:
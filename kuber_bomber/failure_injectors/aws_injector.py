@@ -6,10 +6,53 @@ Injeta falhas em ambientes AWS via SSH usando descoberta automática de IPs.
 Não depende mais de ssh_host fixo no aws_config.json.
 """
 
+import functools
+import os
+import stat
 import subprocess
 import json
 from typing import Dict, List, Optional, Tuple
 
+# ServerAlive* derruba em ~10s uma conexão cujo node foi desligado/reiniciado,
+# senão os comandos seguintes ficariam presos no socket morto.
+SSH_KEEPALIVE_OPTIONS = (
+    '-o', 'ServerAliveInterval=5',
+    '-o', 'ServerAliveCountMax=2',
+)
+
+# Diretório dos sockets ControlMaster (privado do usuário local)
+SSH_CONTROL_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'kuber_bomber', 'ssh')
+
+
+@functools.lru_cache(maxsize=None)
+def ssh_multiplex_options() -> Tuple[str, ...]:
+    """
+    Opções de conexão SSH mestre por node (ControlMaster).
+    
+    Comandos seguidos no mesmo node reaproveitam a sessão já autenticada em
+    vez de refazer TCP + handshake. Os sockets ficam em SSH_CONTROL_DIR,
+    criado com modo 0700 e conferido (dono e permissões) para que outra
+    conta não possa criar ou sequestrar o caminho; %C é um hash de
+    usuário/host/porta remotos. Se o diretório não puder ser usado, a
+    multiplexação é desativada.
+    """
+    try:
+        os.makedirs(SSH_CONTROL_DIR, mode=0o700, exist_ok=True)
+        st = os.lstat(SSH_CONTROL_DIR)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+            raise PermissionError(f"{SSH_CONTROL_DIR} não pertence ao usuário atual")
+        if st.st_mode & 0o077:
+            os.chmod(SSH_CONTROL_DIR, 0o700)
+    except OSError as e:
+        print(f"⚠️ Multiplexação SSH desativada: {e}")
+        return SSH_KEEPALIVE_OPTIONS
+    return (
+        '-o', 'ControlMaster=auto',
+        '-o', f"ControlPath={os.path.join(SSH_CONTROL_DIR, '%C')}",
+        '-o', 'ControlPersist=60',
+        *SSH_KEEPALIVE_OPTIONS,
+    )
+
 
 class AWSFailureInjector:
     """
@@ -90,6 +133,7 @@ class AWSFailureInjector:
                 '-o', 'StrictHostKeyChecking=no',
                 '-o', 'ConnectTimeout=10',
                 '-o', 'BatchMode=yes',
+                *ssh_multiplex_options(),
                 f'{self.ssh_user}@{public_ip}',
                 command
             ]
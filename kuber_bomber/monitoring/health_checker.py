@@ -15,6 +15,10 @@ from typing import Dict, Tuple, Optional, List
 from ..utils.config import get_config
 from ..utils.kubectl_executor import KubectlExecutor
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Máximo de aplicações verificadas ao mesmo tempo em check_all_applications
+MAX_PROBE_WORKERS = 8
 
 class HealthChecker:
     """
@@ -67,7 +71,7 @@ class HealthChecker:
         import time
         
         # Verificar se o cache ainda é válido
-        current_time = time.time()
+        current_time = time.monotonic()
         if (self._control_plane_cache is not None and 
             self._control_plane_cache_time is not None and
             current_time - self._control_plane_cache_time < self._cache_duration):
@@ -255,10 +259,19 @@ class HealthChecker:
             if verbose:
                 print(f"📱 Testando aplicações AWS via control plane: {aws_apps}")
             
-            for app in aws_apps:
-                if verbose:
-                    print(f"🔍 Verificando {app}...")
-                results[app] = self.check_application_health(app, verbose=verbose)
+            if not aws_apps:
+                return results
+            
+            # Sondas em paralelo: o ciclo leva o tempo da aplicação mais lenta,
+            # não a soma de todas (as mensagens verbose podem se intercalar)
+            with ThreadPoolExecutor(max_workers=min(MAX_PROBE_WORKERS, len(aws_apps))) as pool:
+                futures = {}
+                for app in aws_apps:
+                    if verbose:
+                        print(f"🔍 Verificando {app}...")
+                    futures[app] = pool.submit(self.check_application_health, app, verbose=verbose)
+                for app, future in futures.items():
+                    results[app] = future.result()
             
             return results
     
@@ -346,11 +359,11 @@ class HealthChecker:
         print(f"⏳ Aguardando recuperação (timeout: {timeout}s)")
         print(f"📊 Usando timeout configurado: {timeout}s")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         verification_count = 0
         
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
+        while time.monotonic() - start_time < timeout:
+            elapsed = time.monotonic() - start_time
             verification_count += 1
             
             print(f"\n🔍 Verificação #{verification_count} (tempo: {elapsed:.1f}s/{timeout}s)")
@@ -392,7 +405,7 @@ class HealthChecker:
                         print(f"      🔍 Erro: {error_msg}")
             
             if healthy_count == total_services and total_services > 0:
-                recovery_time = time.time() - start_time
+                recovery_time = time.monotonic() - start_time
                 print(f"\n✅ Todas as aplicações recuperadas em {recovery_time:.2f}s")
                 return True, recovery_time
             elif healthy_count > 0:
@@ -423,10 +436,10 @@ class HealthChecker:
         print(f"⏳ Aguardando recuperação de serviços específicos: {target_services}")
         print(f"📊 Timeout: {timeout}s")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
+        while time.monotonic() - start_time < timeout:
+            elapsed = time.monotonic() - start_time
             
             # Verificar apenas os serviços específicos
             all_healthy = True
@@ -439,7 +452,7 @@ class HealthChecker:
                             break
             
             if all_healthy:
-                recovery_time = time.time() - start_time
+                recovery_time = time.monotonic() - start_time
                 print(f"✅ Serviços {target_services} recuperados em {recovery_time:.2f}s")
                 return True, recovery_time
             
@@ -1216,11 +1229,11 @@ class HealthChecker:
         print(f"⏳ Aguardando recuperação combinada (running + curl)")
         print(f"📊 Timeout: {timeout}s")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         check_count = 0
         
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
+        while time.monotonic() - start_time < timeout:
+            elapsed = time.monotonic() - start_time
             check_count += 1
             
             print(f"\n🔍 Verificação #{check_count} (tempo: {elapsed:.1f}s/{timeout}s)")
@@ -1229,7 +1242,7 @@ class HealthChecker:
             all_healthy, pod_details = self.check_pods_combined(verbose=True)
             
             if all_healthy:
-                recovery_time = time.time() - start_time
+                recovery_time = time.monotonic() - start_time
                 print(f"\n✅ Todos os pods recuperados (running + curl) em {recovery_time:.2f}s")
                 return True, recovery_time
             else:
@@ -1352,12 +1365,12 @@ class HealthChecker:
         
         print(f"⏳ Verificação combinada (timeout: {timeout}s)")
         
-        start_time = time.time()
+        start_time = time.monotonic()
         check_count = 0
         kubectl_working = False
         
-        while time.time() - start_time < timeout:
-            elapsed = time.time() - start_time
+        while time.monotonic() - start_time < timeout:
+            elapsed = time.monotonic() - start_time
             check_count += 1
             
             print(f"\\n🔍 Verificação #{check_count} ({elapsed:.1f}s/{timeout}s)")
@@ -1381,7 +1394,7 @@ class HealthChecker:
             all_healthy, pod_details = self.check_pods_combined_silent()
             
             if all_healthy and pod_details:  # Garantir que há pods para verificar
-                recovery_time = time.time() - start_time
+                recovery_time = time.monotonic() - start_time
                 print(f"\\n✅ Recuperação completa em {recovery_time:.2f}s")
                 return True, recovery_time
             
@@ -1396,7 +1409,7 @@ class HealthChecker:
         import time
         from concurrent.futures import ThreadPoolExecutor
 
-        start_time = time.time()
+        start_time = time.monotonic()
         timeout = self.config.current_recovery_timeout
         check_interval = 2.0
 
@@ -1454,15 +1467,15 @@ class HealthChecker:
             current_pods = self.kubectl.get_pods_info()
             # tempo_get_pods += time.time() - tempo_get_pods_start
             
-            start_time = time.time()
-            ultimo_tempo = time.time()
+            start_time = time.monotonic()
+            ultimo_tempo = time.monotonic()
             
             tempo_get_pods = 0.0
             
-            while time.time() - start_time < timeout:
-                ultimo_tempo = time.time()
+            while time.monotonic() - start_time < timeout:
+                ultimo_tempo = time.monotonic()
 
-                elapsed = time.time() - start_time
+                elapsed = time.monotonic() - start_time
                 check_num = int(elapsed / check_interval) + 1
 
                 print(f"\n🔍 Verificação #{check_num} (tempo: {elapsed:.1f}s/{timeout}s)")
@@ -1487,9 +1500,9 @@ class HealthChecker:
                     stop_thread.set()
                     return True, recovery_time
                 
-                tempo_get_pods_start = time.time()
+                tempo_get_pods_start = time.monotonic()
                 current_pods = self.kubectl.get_pods_info()
-                tempo_get_pods += time.time() - tempo_get_pods_start
+                tempo_get_pods += time.monotonic() - tempo_get_pods_start
                     
                 # print(f"⏸️ Aguardando {check_interval}s...")
                 # time.sleep(check_interval)
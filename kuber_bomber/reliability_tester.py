@@ -14,7 +14,8 @@ import os
 
 # Adicionar path para imports
 # Adicionar parent directory (volta uma pasta)
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+framework_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(framework_dir)
 sys.path.insert(0, parent_dir)
 
 def main():
@@ -27,7 +28,7 @@ def main():
         print("🔧 Verificando estrutura do framework...")
         
         # Debug das importações
-        framework_path = os.path.join(os.path.dirname(os.path.abspath(__file__)))
+        framework_path = framework_dir
         if not os.path.exists(framework_path):
             print(f"❌ Diretório não encontrado: {framework_path}")
             return
@@ -38,6 +39,8 @@ def main():
         try:
             from kuber_bomber.core.reliability_tester import ReliabilityTester
             from kuber_bomber.utils.config import get_current_recovery_timeout
+            from kuber_bomber.utils.logging_config import setup_cli_logging
+            setup_cli_logging()
             
             print("✅ Importações básicas funcionando")
             print(f"⏰ Timeout atual: {get_current_recovery_timeout()}s")
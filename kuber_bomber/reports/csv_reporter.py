@@ -9,7 +9,29 @@ durante a execução dos testes.
 import os
 import csv
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
+
+# Buffer do arquivo CSV em tempo real (as linhas saem em lote no flush)
+_REALTIME_BUFFER = 64 * 1024
+
+
+def _env_batch_size() -> int:
+    """
+    Tamanho do lote do CSV em tempo real via KUBER_BOMBER_CSV_BATCH.
+    
+    Valores inválidos (não inteiros ou < 1) geram um aviso e caem para 1.
+    """
+    raw = os.environ.get('KUBER_BOMBER_CSV_BATCH')
+    if not raw:
+        return 1
+    try:
+        batch_size = int(raw)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        print(f"⚠️ KUBER_BOMBER_CSV_BATCH inválido ({raw!r}); gravando a cada iteração")
+        return 1
+    return batch_size
 
 
 class CSVReporter:
@@ -23,12 +45,14 @@ class CSVReporter:
     e salva tanto dados de iterações quanto métricas de componentes.
     """
     
-    def __init__(self, base_dir: Optional[str] = None):
+    def __init__(self, base_dir: Optional[str] = None, realtime_batch_size: Optional[int] = None):
         """
         Inicializa o gerador de relatórios CSV.
         
         Args:
             base_dir: Diretório base para salvar relatórios
+            realtime_batch_size: Iterações acumuladas antes de gravar no CSV em
+                tempo real (padrão: KUBER_BOMBER_CSV_BATCH ou 1, grava a cada iteração)
         """
         if base_dir is None:
             # Usar diretório atual por padrão
@@ -39,6 +63,11 @@ class CSVReporter:
         self.current_writer = None
         self.current_csvfile = None
         self._is_realtime_active = False
+        if realtime_batch_size is None:
+            realtime_batch_size = _env_batch_size()
+        self.realtime_batch_size = max(1, realtime_batch_size)
+        # Linhas do relatório em tempo real ainda não gravadas
+        self._pending_rows: List[Dict] = []
     
     def create_simulation_directory(self, iteration: int) -> str:
         """
@@ -156,15 +185,20 @@ class CSVReporter:
         ]
         
         try:
-            self.current_csvfile = open(interactions_path, 'w', newline='', encoding='utf-8')
+            self.current_csvfile = open(interactions_path, 'w', newline='', encoding='utf-8',
+                                        buffering=_REALTIME_BUFFER)
             self.current_writer = csv.DictWriter(self.current_csvfile, fieldnames=fieldnames)
             self.current_writer.writeheader()
             self.current_csvfile.flush()  # Forçar escrita do cabeçalho
             self.current_file = interactions_path
+            self._pending_rows = []
             self._is_realtime_active = True
             print(f"📊 📝 Relatório em tempo real iniciado: {interactions_path}")
             print(f"📁 Estrutura: {run_dir}/interactions.csv e metrics.csv")
-            print(f"⚡ CSV será atualizado a cada iteração concluída")
+            if self.realtime_batch_size > 1:
+                print(f"⚡ CSV será atualizado a cada {self.realtime_batch_size} iterações concluídas")
+            else:
+                print(f"⚡ CSV será atualizado a cada iteração concluída")
             return interactions_path
         except Exception as e:
             print(f"❌ Erro ao iniciar relatório em tempo real: {e}")
@@ -197,20 +231,46 @@ class CSVReporter:
                 progress = (result['iteration'] / total_iterations) * 100
                 csv_result['test_progress'] = f"{progress:.1f}%"
             
-            self.current_writer.writerow(csv_result)
-            self.current_csvfile.flush()  # ⭐ FORÇAR ESCRITA IMEDIATA ⭐
-            
+            self._pending_rows.append(csv_result)
             iteration_num = result.get('iteration', '?')
             recovery_time = result.get('recovery_time_seconds', 0)
             recovered = result.get('recovered', False)
             
-            print(f"📊 ✅ Iteração {iteration_num} salva em tempo real!")
+            if len(self._pending_rows) >= self.realtime_batch_size:
+                self._flush_realtime_rows()  # ⭐ GRAVAR O LOTE ⭐
+                print(f"📊 ✅ Iteração {iteration_num} salva em tempo real!")
+            else:
+                print(f"📊 ⏳ Iteração {iteration_num} registrada "
+                      f"({len(self._pending_rows)}/{self.realtime_batch_size} do lote)")
             print(f"   ⏱️ MTTR: {recovery_time:.2f}s | Recuperou: {'✅' if recovered else '❌'}")
             print(f"   📁 Arquivo: {os.path.basename(self.current_file) if self.current_file else 'N/A'}")
             
         except Exception as e:
             print(f"❌ Erro ao salvar resultado em tempo real: {e}")
     
+    def _flush_realtime_rows(self):
+        """Grava as linhas pendentes do relatório em tempo real num único flush."""
+        if self._pending_rows:
+            self.current_writer.writerows(self._pending_rows)
+            self._pending_rows.clear()
+        self.current_csvfile.flush()
+    
+    def flush_realtime_report(self):
+        """
+        Grava imediatamente as iterações ainda pendentes do lote.
+        
+        Chamado quando o teste é interrompido, antes de qualquer outro
+        processamento, para que o CSV em tempo real não perca linhas.
+        """
+        if not self._is_realtime_active or not self.current_writer or not self.current_csvfile:
+            return
+        try:
+            if self._pending_rows:
+                print(f"💾 Gravando {len(self._pending_rows)} iterações pendentes no CSV")
+            self._flush_realtime_rows()
+        except Exception as e:
+            print(f"❌ Erro ao gravar iterações pendentes: {e}")
+    
     def update_realtime_progress(self, iteration: int, total_iterations: int, message: str = ""):
         """
         Atualiza progresso no arquivo em tempo real com uma linha de status.
@@ -241,21 +301,25 @@ class CSVReporter:
             summary_stats: Estatísticas finais para adicionar (opcional)
         """
         try:
+            if self._pending_rows and self.current_writer and self.current_csvfile:
+                self._flush_realtime_rows()
+            
             if summary_stats and self.current_writer and self.current_csvfile:
-                # Adicionar linha de resumo ao final
+                # Adicionar linha de resumo ao final (um único instante para os dois campos)
+                now_iso = datetime.now().isoformat()
                 summary_row = {
                     'iteration': 'RESUMO',
                     'component_type': summary_stats.get('component_type', ''),
                     'component_id': summary_stats.get('target', ''),
                     'failure_method': summary_stats.get('failure_method', ''),
                     'executed_command': f"Total: {summary_stats.get('total_iterations', 0)} iterações",
-                    'failure_timestamp': datetime.now().isoformat(),
+                    'failure_timestamp': now_iso,
                     'recovery_time_seconds': summary_stats.get('average_mttr', 0),
                     'total_time_seconds': summary_stats.get('total_test_time', 0),
                     'recovered': f"{summary_stats.get('success_rate', 0):.1f}% sucesso",
                     'initial_healthy_apps': '',
                     'test_progress': '100%',
-                    'real_time_saved': datetime.now().isoformat()
+                    'real_time_saved': now_iso
                 }
                 
                 self.current_writer.writerow(summary_row)
@@ -343,7 +407,8 @@ class CSVReporter:
         except Exception as e:
             print(f"❌ Erro ao salvar registro de simulação: {e}")
     
-    def save_component_metrics(self, component_metrics: Dict, suffix: str = "", component_type: Optional[str] = None, failure_method: Optional[str] = None):
+    def save_component_metrics(self, component_metrics: Dict, suffix: str = "", component_type: Optional[str] = None, failure_method: Optional[str] = None,
+                               get_stats: Optional[Callable[[str], Dict]] = None):
         """
         Salva métricas individuais por componente em CSV.
         
@@ -352,6 +417,9 @@ class CSVReporter:
             suffix: Sufixo para o nome do arquivo
             component_type: Tipo do componente para pasta (obrigatório)
             failure_method: Método para pasta (obrigatório)
+            get_stats: Estatísticas já mantidas por componente (ex.:
+                MetricsAnalyzer.get_component_statistics); se None, calcula
+                a partir dos recovery_times
         """
         if not component_metrics:
             print("📊 Nenhuma métrica de componente para salvar")
@@ -393,8 +461,11 @@ class CSVReporter:
                 writer.writeheader()
                 
                 for component_id, metrics in component_metrics.items():
-                    # Calcular estatísticas para este componente
-                    stats = self._calculate_component_stats(component_id, metrics)
+                    # Reaproveitar as estatísticas do analisador quando disponíveis
+                    if get_stats is not None:
+                        stats = get_stats(component_id)
+                    else:
+                        stats = self._calculate_component_stats(component_id, metrics)
                     if stats:
                         writer.writerow(stats)
             
@@ -427,7 +498,7 @@ class CSVReporter:
                 'total_failures': total_failures,
                 'successful_recoveries': successful_recoveries,
                 'availability_percent': (successful_recoveries / total_failures * 100) if total_failures > 0 else 0,
-                'mttr_mean': statistics.mean(recovery_times) if recovery_times else 0,
+                'mttr_mean': statistics.fmean(recovery_times) if recovery_times else 0,
                 'mttr_median': statistics.median(recovery_times) if recovery_times else 0,
                 'mttr_min': min(recovery_times) if recovery_times else 0,
                 'mttr_max': max(recovery_times) if recovery_times else 0,
@@ -5,6 +5,8 @@ Analisador de Métricas
 Módulo para análise e cálculo de métricas de confiabilidade.
 """
 
+import bisect
+import math
 import statistics
 from datetime import datetime
 from typing import Dict, List
@@ -27,6 +29,10 @@ class MetricsAnalyzer:
         """
         self.config = config if config is not None else get_config()
         self.component_metrics = {}
+        # Agregados incrementais por componente: média e M2 de Welford (desvio
+        # padrão), cópia ordenada dos tempos (mediana/mín/máx sem reordenar) e
+        # o último snapshot. Os recovery_times públicos seguem em ordem cronológica
+        self._running_stats: Dict[str, Dict] = {}
     
     def update_component_metrics(self, component_id: str, component_type: str, 
                                recovery_time: float, recovered: bool):
@@ -54,10 +60,23 @@ class MetricsAnalyzer:
         metrics['total_failures'] += 1
         metrics['failure_timestamps'].append(datetime.now().isoformat())
         
+        running = self._running_stats.get(component_id)
+        if running is None:
+            running = self._running_stats[component_id] = {
+                'mean': 0.0, 'm2': 0.0, 'sorted_times': [], 'snapshot': None
+            }
+        running['snapshot'] = None
+        
         if recovered:
             metrics['successful_recoveries'] += 1
             metrics['recovery_times'].append(recovery_time)
-            metrics['mttr_current'] = statistics.mean(metrics['recovery_times'])
+            bisect.insort(running['sorted_times'], recovery_time)
+            
+            # Atualização O(1) da média/variância (Welford) em vez de recalcular tudo
+            delta = recovery_time - running['mean']
+            running['mean'] += delta / metrics['successful_recoveries']
+            running['m2'] += delta * (recovery_time - running['mean'])
+            metrics['mttr_current'] = running['mean']
         
         # Calcular disponibilidade (% de recuperações bem-sucedidas)
         metrics['availability'] = (metrics['successful_recoveries'] / metrics['total_failures']) * 100
@@ -66,6 +85,9 @@ class MetricsAnalyzer:
         """
         Retorna estatísticas detalhadas de um componente específico.
         
+        Usa os agregados mantidos por update_component_metrics; o snapshot é
+        montado uma vez por atualização e copiado a cada chamada.
+        
         Args:
             component_id: ID do componente
             
@@ -75,23 +97,27 @@ class MetricsAnalyzer:
         if component_id not in self.component_metrics:
             return {}
         
-        metrics = self.component_metrics[component_id]
-        recovery_times = metrics['recovery_times']
-        
-        stats = {
-            'component_id': component_id,
-            'component_type': metrics['component_type'],
-            'total_failures': metrics['total_failures'],
-            'successful_recoveries': metrics['successful_recoveries'],
-            'availability_percent': metrics['availability'],
-            'mttr_mean': statistics.mean(recovery_times) if recovery_times else 0,
-            'mttr_median': statistics.median(recovery_times) if recovery_times else 0,
-            'mttr_min': min(recovery_times) if recovery_times else 0,
-            'mttr_max': max(recovery_times) if recovery_times else 0,
-            'mttr_std_dev': statistics.stdev(recovery_times) if len(recovery_times) > 1 else 0
-        }
-        
-        return stats
+        running = self._running_stats[component_id]
+        if running['snapshot'] is None:
+            metrics = self.component_metrics[component_id]
+            sorted_times = running['sorted_times']
+            n = len(sorted_times)
+            mid = n // 2
+            
+            running['snapshot'] = {
+                'component_id': component_id,
+                'component_type': metrics['component_type'],
+                'total_failures': metrics['total_failures'],
+                'successful_recoveries': metrics['successful_recoveries'],
+                'availability_percent': metrics['availability'],
+                'mttr_mean': running['mean'] if n else 0,
+                'mttr_median': (sorted_times[mid] if n % 2 else (sorted_times[mid - 1] + sorted_times[mid]) / 2) if n else 0,
+                'mttr_min': sorted_times[0] if n else 0,
+                'mttr_max': sorted_times[-1] if n else 0,
+                'mttr_std_dev': math.sqrt(running['m2'] / (n - 1)) if n > 1 else 0
+            }
+        
+        return dict(running['snapshot'])
     
     def calculate_and_print_statistics(self, results: List[Dict]):
         """
@@ -111,7 +137,7 @@ class MetricsAnalyzer:
         print(f"✅ Taxa de sucesso: {success_rate:.1f}% ({len(recovery_times)}/{len(results)})")
         
         if recovery_times:
-            print(f"⏱️ MTTR Médio: {statistics.mean(recovery_times):.2f}s")
+            print(f"⏱️ MTTR Médio: {statistics.fmean(recovery_times):.2f}s")
             print(f"📈 MTTR Máximo: {max(recovery_times):.2f}s")
             print(f"📉 MTTR Mínimo: {min(recovery_times):.2f}s")
             if len(recovery_times) > 1:
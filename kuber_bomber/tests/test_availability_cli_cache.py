@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Testes dos Caches de Descoberta e MTTR do CLI
+=============================================
+
+Verifica o cache em disco de generate_config_with_discovery: TTL da
+descoberta, reaproveitamento da análise MTTR completa e as variáveis
+KUBER_BOMBER_DISCOVERY_CACHE_DIR / KUBER_BOMBER_MTTR_TTL.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from kuber_bomber.cli import availability_cli
+from kuber_bomber.cli.availability_cli import (
+    _discovery_cache_path, _load_cached_discovery, _save_cached_discovery,
+)
+from kuber_bomber.utils import infrastructure_discovery
+
+# Identificador do cluster local usado nos testes (sem chamar kubectl)
+LOCAL_ID = 'local|/home/user/.kube/config|kind-a|https://127.0.0.1:6443'
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Cache e arquivo de saída isolados em tmp_path."""
+    directory = tmp_path / 'cache'
+    monkeypatch.setenv('KUBER_BOMBER_DISCOVERY_CACHE_DIR', str(directory))
+    monkeypatch.delenv('KUBER_BOMBER_MTTR_TTL', raising=False)
+    monkeypatch.setattr(availability_cli, 'DEFAULT_CONFIG_FILE', str(tmp_path / 'out' / 'config.json'))
+    monkeypatch.setattr(availability_cli, '_local_cluster_id', lambda: LOCAL_ID)
+    return directory
+
+
+@pytest.fixture
+def no_discovery(monkeypatch):
+    """Falha o teste se a descoberta real (kubectl) for executada."""
+    def fail(*args, **kwargs):
+        raise AssertionError("descoberta executada apesar do cache")
+    monkeypatch.setattr(infrastructure_discovery, 'InfrastructureDiscovery', fail)
+
+
+def _read_output():
+    with open(availability_cli.DEFAULT_CONFIG_FILE) as f:
+        return json.load(f)
+
+
+def test_cache_path_uses_env_dir_and_key(cache_dir):
+    local = _discovery_cache_path(LOCAL_ID, 5)
+    assert os.path.dirname(local) == str(cache_dir)
+    assert local == _discovery_cache_path(LOCAL_ID, 5)
+    assert local != _discovery_cache_path(LOCAL_ID, 3)
+    assert local != _discovery_cache_path(LOCAL_ID.replace('kind-a', 'kind-b'), 5)
+    assert local != _discovery_cache_path('aws|aws_config.json|1|1.2.3.4', 5)
+
+
+def test_unknown_local_cluster_disables_cache(cache_dir, monkeypatch):
+    """Sem contexto do kubectl identificável, a descoberta sempre roda."""
+    _save_cached_discovery(_discovery_cache_path('local', 5), {'mttf_config': {}})
+    monkeypatch.setattr(availability_cli, '_local_cluster_id', lambda: None)
+    discovered = {'mttf_config': {'pods': {'novo': 1.0}}}
+
+    class FakeDiscovery:
+        def __init__(self, **kwargs):
+            pass
+
+        def discover_and_generate_config(self, iterations):
+            availability_cli.write_json_atomic(availability_cli.DEFAULT_CONFIG_FILE, discovered)
+            return discovered, availability_cli.DEFAULT_CONFIG_FILE
+
+    os.makedirs(os.path.dirname(availability_cli.DEFAULT_CONFIG_FILE))
+    monkeypatch.setattr(infrastructure_discovery, 'InfrastructureDiscovery', FakeDiscovery)
+
+    availability_cli.generate_config_with_discovery(iterations=5)
+
+    assert _read_output() == discovered
+
+
+def test_cached_discovery_respects_ttl(cache_dir):
+    path = _discovery_cache_path(LOCAL_ID, 5)
+    data = {'experiment_config': {'applications': {'foo': True}}, 1: 'chave int'}
+    _save_cached_discovery(path, data)
+
+    assert _load_cached_discovery(path, 600) == {'experiment_config': {'applications': {'foo': True}},
+                                                 '1': 'chave int'}
+    assert _load_cached_discovery(path, 0) is None
+
+    old = time.time() - 601
+    os.utime(path, (old, old))
+    assert _load_cached_discovery(path, 600) is None
+
+
+def test_missing_or_corrupt_cache_is_ignored(cache_dir):
+    path = _discovery_cache_path(LOCAL_ID, 5)
+    assert _load_cached_discovery(path, 600) is None
+
+    os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write('{"truncado": ')
+    assert _load_cached_discovery(path, 600) is None
+
+
+def test_discovery_cache_skips_discovery(cache_dir, no_discovery):
+    cached = {'experiment_config': {}, 'mttf_config': {'pods': {'foo': 1.0}}}
+    _save_cached_discovery(_discovery_cache_path(LOCAL_ID, 5), cached)
+
+    filepath = availability_cli.generate_config_with_discovery(iterations=5)
+
+    assert filepath == availability_cli.DEFAULT_CONFIG_FILE
+    assert _read_output() == cached
+
+
+def test_complete_mttr_cache_is_reused(cache_dir, no_discovery):
+    path = _discovery_cache_path(LOCAL_ID, 5)
+    mttr_config = {'mttr_config': {'pods': {'foo': 0.01}}}
+    _save_cached_discovery(path[:-len('.json')] + '.mttr.json',
+                           {'mttr_complete': True, 'config': mttr_config})
+
+    availability_cli.generate_config_with_discovery(iterations=5, run_mttr_analysis=True)
+
+    # A marca do cache não vaza para o config do usuário
+    assert _read_output() == mttr_config
+
+
+def test_mttr_analysis_saves_marker_only_in_cache(cache_dir, monkeypatch):
+    """Após a análise, o config salvo não tem mttr_complete; o .mttr.json sim."""
+    path = _discovery_cache_path(LOCAL_ID, 5)
+    _save_cached_discovery(path, {'experiment_config': {}})
+
+    class FakeAnalyzer:
+        def __init__(self, **kwargs):
+            pass
+
+        def run_complete_analysis(self, config):
+            return dict(config, mttr_config={'pods': {'foo': 0.02}})
+
+    from kuber_bomber.utils import mttr_analyzer
+    monkeypatch.setattr(mttr_analyzer, 'MTTRAnalyzer', FakeAnalyzer)
+
+    availability_cli.generate_config_with_discovery(iterations=5, run_mttr_analysis=True,
+                                                    assume_yes=True)
+
+    expected = {'experiment_config': {}, 'mttr_config': {'pods': {'foo': 0.02}}}
+    assert _read_output() == expected
+    with open(path[:-len('.json')] + '.mttr.json') as f:
+        assert json.load(f) == {'mttr_complete': True, 'config': expected}
+
+
+@pytest.mark.parametrize('mttr_cached, mttr_ttl', [
+    ({'mttr_complete': True, 'config': {'mttr_config': {}}}, '0'),
+    ({'config': {'mttr_config': {}}}, None),
+    # Formato antigo (marca dentro do config) é ignorado
+    ({'mttr_config': {}, 'mttr_complete': True}, None),
+])
+def test_mttr_cache_ignored_when_disabled_or_incomplete(cache_dir, no_discovery, monkeypatch,
+                                                        mttr_cached, mttr_ttl):
+    """TTL 0 ou análise sem mttr_complete caem para a descoberta (e o prompt MTTR)."""
+    if mttr_ttl is not None:
+        monkeypatch.setenv('KUBER_BOMBER_MTTR_TTL', mttr_ttl)
+    path = _discovery_cache_path(LOCAL_ID, 5)
+    discovery_cached = {'mttf_config': {'pods': {'foo': 1.0}}}
+    _save_cached_discovery(path, discovery_cached)
+    _save_cached_discovery(path[:-len('.json')] + '.mttr.json', mttr_cached)
+    prompts = []
+    monkeypatch.setattr('builtins.input', lambda prompt='': prompts.append(prompt) or 'n')
+
+    availability_cli.generate_config_with_discovery(iterations=5, run_mttr_analysis=True)
+
+    assert _read_output() == discovery_cached
+    assert len(prompts) == 1
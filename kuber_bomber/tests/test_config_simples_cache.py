@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Testes dos Caches do ConfigSimples
+==================================
+
+Verifica que o índice de MTTR responde como a busca linear original e que
+configs regravados são relidos e substituídos de forma atômica.
+"""
+
+import os
+
+import pytest
+
+from kuber_bomber.core.config_simples import ConfigSimples
+from kuber_bomber.utils.json_utils import write_bytes_atomic
+
+
+def _linear_get_mttr(mt, component_name):
+    """Busca linear de get_mttr antes do índice (referência do comportamento)."""
+    if not isinstance(mt, dict):
+        return 0.0
+    if component_name in mt and isinstance(mt[component_name], (int, float)):
+        return mt[component_name]
+    for store_key in ('worker_node', 'worker_nodes', 'control_plane'):
+        store = mt.get(store_key)
+        if isinstance(store, dict):
+            if component_name in store and isinstance(store[component_name], (int, float)):
+                return store[component_name]
+            if '-' in component_name:
+                comp_type = component_name.split('-')[0]
+                if comp_type in store and isinstance(store[comp_type], (int, float)):
+                    return store[comp_type]
+    for store_key in ('worker_components', 'control_components'):
+        if isinstance(mt.get(store_key), dict) and '-' in component_name:
+            key, node = component_name.split('-', 1)
+            comp_map = mt[store_key].get(node, {})
+            if isinstance(comp_map, dict) and key in comp_map:
+                return comp_map[key]
+    return 0.0
+
+
+MTTR_CONFIGS = [
+    # Formato plano
+    {'wn_runtime-worker-1': 3.0, 'cp_etcd-control-plane': 7.5, 'bar-pod': 1},
+    # Formato aninhado novo
+    {
+        'worker_node': {'wn_runtime': 50.0, 'worker_node': 400.0, 'worker-1': 12.0},
+        'control_plane': {'cp_etcd': 90.0, 'control_plane': 600.0},
+    },
+    # Formato aninhado antigo
+    {
+        'worker_nodes': {'worker-1': 30.0, 'wn_proxy': 'n/a'},
+        'worker_components': {'worker-1': {'wn_runtime': 4.0, 'wn_kubelet': 6.0}},
+        'control_components': {'control-plane': {'cp_apiserver': 8.0}},
+    },
+    # Chaves em conflito: vale a primeira store na ordem de busca
+    {
+        'wn_runtime-worker-1': 1.0,
+        'worker_node': {'wn_runtime': 2.0, 'wn_kubelet-worker-1': 9.0},
+        'worker_nodes': {'wn_kubelet': 3.0, 'wn_proxy-worker-1': 4.0},
+        'control_plane': {'wn_proxy': 5.0},
+        'worker_components': {'worker-1': {'wn_runtime': 6.0, 'wn_proxy': 7.0}},
+    },
+]
+
+COMPONENT_NAMES = [
+    'wn_runtime-worker-1', 'wn_kubelet-worker-1', 'wn_proxy-worker-1',
+    'cp_etcd-control-plane', 'cp_apiserver-control-plane', 'worker-1',
+    'worker_node', 'control_plane', 'bar-pod', 'sem-mttr', 'sem_hifen',
+]
+
+
+@pytest.mark.parametrize('mttr_config', MTTR_CONFIGS)
+def test_mttr_index_matches_linear_scan(mttr_config):
+    """get_mttr indexado devolve o mesmo valor que a busca store por store."""
+    config = ConfigSimples(config_data={'mttr_config': mttr_config})
+    for name in COMPONENT_NAMES:
+        assert config.get_mttr(name) == _linear_get_mttr(mttr_config, name), name
+
+
+def test_mttr_without_config_is_zero():
+    """Sem mttr_config (ou com formato inválido) o MTTR é 0.0."""
+    assert ConfigSimples(config_data={}).get_mttr('wn_runtime-worker-1') == 0.0
+    assert ConfigSimples(config_data={'mttr_config': [1, 2]}).get_mttr('x') == 0.0
+
+
+def test_load_from_json_sees_rewritten_file(tmp_path):
+    """Cada carga relê o arquivo: um config regravado nunca volta desatualizado."""
+    path = str(tmp_path / 'config.json')
+    ConfigSimples(config_data={'mttr_config': {'foo': 1.0}}).save_config(path)
+    first = ConfigSimples.load_from_json(path)
+    ConfigSimples(config_data={'mttr_config': {'foo': 2.0}}).save_config(path)
+    second = ConfigSimples.load_from_json(path)
+
+    assert first.get_mttr('foo') == 1.0
+    assert second.get_mttr('foo') == 2.0
+    assert second.config_data is not first.config_data
+
+
+def testwrite_bytes_atomic_replaces_file_atomically(tmp_path):
+    """write_bytes_atomic troca o arquivo inteiro e não deixa o temporário para trás."""
+    path = str(tmp_path / 'saved.json')
+    write_bytes_atomic(path, b'{"a": 1, "b": 2}')
+    write_bytes_atomic(path, b'{}', durable=True)
+    with open(path, 'rb') as f:
+        assert f.read() == b'{}'
+    assert os.listdir(tmp_path) == ['saved.json']
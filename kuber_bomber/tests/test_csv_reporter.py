@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Testes do CSV em Tempo Real
+===========================
+
+Verifica o lote do CSV em tempo real: validação de KUBER_BOMBER_CSV_BATCH
+e gravação das iterações pendentes quando o teste é interrompido.
+"""
+
+import csv
+
+import pytest
+
+from kuber_bomber.reports.csv_reporter import CSVReporter
+
+
+@pytest.mark.parametrize('raw, expected', [
+    (None, 1), ('3', 3), ('0', 1), ('-2', 1), ('auto', 1),
+])
+def test_batch_size_from_env(monkeypatch, tmp_path, raw, expected):
+    """Valores inválidos caem para 1 em vez de quebrar a construção."""
+    if raw is None:
+        monkeypatch.delenv('KUBER_BOMBER_CSV_BATCH', raising=False)
+    else:
+        monkeypatch.setenv('KUBER_BOMBER_CSV_BATCH', raw)
+    assert CSVReporter(base_dir=str(tmp_path)).realtime_batch_size == expected
+
+
+def _rows(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+def test_pending_rows_flushed_on_interrupt(tmp_path):
+    """Iterações ainda no lote chegam ao arquivo com flush_realtime_report."""
+    reporter = CSVReporter(base_dir=str(tmp_path), realtime_batch_size=5)
+    path = reporter.start_realtime_report('pod', 'kill_processes', 'foo')
+    for iteration in (1, 2):
+        reporter.add_realtime_result({'iteration': iteration, 'recovery_time_seconds': 1.5,
+                                      'recovered': True}, total_iterations=10)
+    assert _rows(path) == []
+
+    reporter.flush_realtime_report()
+
+    assert [row['iteration'] for row in _rows(path)] == ['1', '2']
+    reporter.finish_realtime_report()
+    assert [row['iteration'] for row in _rows(path)] == ['1', '2']
+
+
+def test_component_metrics_use_analyzer_statistics(tmp_path):
+    """metrics.csv usa as estatísticas do MetricsAnalyzer, sem recalcular."""
+    from kuber_bomber.reports.metrics_analyzer import MetricsAnalyzer
+    analyzer = MetricsAnalyzer(config={})
+    for recovery_time in (9.0, 1.0, 5.0):
+        analyzer.update_component_metrics('pod-a', 'pod', recovery_time, True)
+    reporter = CSVReporter(base_dir=str(tmp_path))
+    reporter._current_run_dir = str(tmp_path)
+
+    reporter.save_component_metrics(analyzer.component_metrics,
+                                    get_stats=analyzer.get_component_statistics)
+
+    (row,) = _rows(tmp_path / 'metrics.csv')
+    assert (row['mttr_median'], row['mttr_min'], row['mttr_max']) == ('5.0', '1.0', '9.0')
+    assert analyzer.component_metrics['pod-a']['recovery_times'] == [9.0, 1.0, 5.0]
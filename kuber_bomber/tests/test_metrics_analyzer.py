@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Testes das Estatísticas Incrementais do MetricsAnalyzer
+=======================================================
+
+Compara os agregados mantidos a cada atualização (Welford + cópia ordenada)
+com o cálculo em lote sobre todos os tempos de recuperação.
+"""
+
+import random
+import statistics
+
+import pytest
+
+from kuber_bomber.reports.metrics_analyzer import MetricsAnalyzer
+
+
+def _batch_stats(times):
+    """Estatísticas calculadas de uma vez sobre todos os tempos."""
+    return {
+        'mttr_mean': statistics.fmean(times) if times else 0,
+        'mttr_median': statistics.median(times) if times else 0,
+        'mttr_min': min(times) if times else 0,
+        'mttr_max': max(times) if times else 0,
+        'mttr_std_dev': statistics.stdev(times) if len(times) > 1 else 0,
+    }
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_running_stats_match_batch(seed):
+    """A cada atualização os agregados incrementais batem com o lote."""
+    rng = random.Random(seed)
+    analyzer = MetricsAnalyzer(config={})
+    recovered_times = []
+
+    for i in range(1, 60):
+        recovered = rng.random() > 0.2
+        recovery_time = rng.uniform(0.5, 120.0)
+        analyzer.update_component_metrics('pod-a', 'pod', recovery_time, recovered)
+        if recovered:
+            recovered_times.append(recovery_time)
+
+        stats = analyzer.get_component_statistics('pod-a')
+        assert stats['total_failures'] == i
+        assert stats['successful_recoveries'] == len(recovered_times)
+        for key, expected in _batch_stats(recovered_times).items():
+            assert stats[key] == pytest.approx(expected), key
+
+    # recovery_times públicos seguem a ordem cronológica das recuperações
+    assert analyzer.component_metrics['pod-a']['recovery_times'] == recovered_times
+
+
+def test_statistics_snapshot_is_a_copy():
+    """Alterar o dicionário retornado não afeta as próximas consultas."""
+    analyzer = MetricsAnalyzer(config={})
+    analyzer.update_component_metrics('node-1', 'worker_node', 10.0, True)
+
+    stats = analyzer.get_component_statistics('node-1')
+    stats['mttr_mean'] = -1
+    assert analyzer.get_component_statistics('node-1')['mttr_mean'] == 10.0
+
+    analyzer.update_component_metrics('node-1', 'worker_node', 20.0, True)
+    assert analyzer.get_component_statistics('node-1')['mttr_mean'] == 15.0
+
+
+def test_unknown_component_has_no_statistics():
+    analyzer = MetricsAnalyzer(config={})
+    assert analyzer.get_component_statistics('inexistente') == {}
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Testes da Espera entre Iterações
+================================
+
+Verifica as marcas de progresso de ReliabilityTester._wait_interval sem
+montar o testador completo (que depende de kubectl/cluster).
+"""
+
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from kuber_bomber.core.reliability_tester import ReliabilityTester
+
+
+class FakeEvent:
+    """Evento que registra as esperas e sinaliza parada após N chamadas."""
+
+    def __init__(self, stop_after=None):
+        self.timeouts = []
+        self.stop_after = stop_after
+
+    def wait(self, timeout):
+        self.timeouts.append(timeout)
+        return self.stop_after is not None and len(self.timeouts) >= self.stop_after
+
+
+def _run_wait(interval, event, caplog):
+    fake_tester = SimpleNamespace(stop_simulation_event=event)
+    with caplog.at_level(logging.INFO, logger='kuber_bomber.core.reliability_tester'):
+        stopped = ReliabilityTester._wait_interval(fake_tester, interval)
+    marks = [r.args[0] for r in caplog.records if r.msg.startswith('⏳')]
+    return stopped, marks
+
+
+@pytest.mark.parametrize('interval, expected_marks', [
+    (0, []),
+    (3, [3, 2, 1]),
+    (10, [10, 9, 8, 7, 6, 5, 4, 3, 2, 1]),
+    (35, [30, 20, 10, 9, 8, 7, 6, 5, 4, 3, 2, 1]),
+])
+def test_wait_interval_marks(interval, expected_marks, caplog):
+    """Marca a cada 10s e a cada segundo nos últimos 10s; espera total = intervalo."""
+    event = FakeEvent()
+    stopped, marks = _run_wait(interval, event, caplog)
+
+    assert stopped is False
+    assert marks == expected_marks
+    assert sum(event.timeouts) == interval
+    assert all(timeout >= 0 for timeout in event.timeouts)
+
+
+def test_wait_interval_stops_on_event(caplog):
+    """O evento de parada interrompe a espera na hora."""
+    event = FakeEvent(stop_after=2)
+    stopped, marks = _run_wait(65, event, caplog)
+
+    assert stopped is True
+    assert marks == [60]
+    assert event.timeouts == [5, 10]
@@ -13,6 +13,8 @@ from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime
 import os
 
+from kuber_bomber.utils.json_utils import loads_json, write_json_atomic
+
 
 class InfrastructureDiscovery:
     """
@@ -117,7 +119,7 @@ class InfrastructureDiscovery:
             return {}
         
         try:
-            pods_data = json.loads(output)
+            pods_data = loads_json(output)
             pods_by_app = {}
             
             for pod in pods_data.get('items', []):
@@ -167,7 +169,7 @@ class InfrastructureDiscovery:
             return []
         
         try:
-            nodes_data = json.loads(output)
+            nodes_data = loads_json(output)
             worker_nodes = []
             
             for node in nodes_data.get('items', []):
@@ -208,7 +210,7 @@ class InfrastructureDiscovery:
             return []
         
         try:
-            nodes_data = json.loads(output)
+            nodes_data = loads_json(output)
             control_plane_nodes = []
             
             for node in nodes_data.get('items', []):
@@ -412,8 +414,7 @@ class InfrastructureDiscovery:
         # Garantir que o diretório existe
         os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        write_json_atomic(filepath, config)
         
         print(f"💾 Configuração salva em: {filepath}")
         return filepath
@@ -465,8 +466,8 @@ def load_aws_config(config_file: str = "aws_config.json") -> Dict[str, Any]:
     """
     try:
         if os.path.exists(config_file):
-            with open(config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(config_file, 'rb') as f:
+                return loads_json(f.read())
     except Exception as e:
         print(f"⚠️ Erro ao carregar configuração AWS: {e}")
     
@@ -0,0 +1,78 @@
+"""
+Leitura e escrita de JSON com orjson opcional.
+
+orjson (em C) é usado quando instalado; sem ele, cai para o json da stdlib
+com a mesma saída: indentação de 2 espaços, UTF-8 e chaves não-string aceitas.
+As gravações em disco passam todas por write_bytes_atomic (temporário +
+os.replace), com fsync apenas quando pedido.
+"""
+
+import json
+import os
+from typing import Any
+
+try:
+    import orjson  # decodificador/serializador em C, opcional
+except ImportError:
+    orjson = None
+
+
+def loads_json(raw) -> Any:
+    """Decodifica JSON com orjson quando disponível (erros são json.JSONDecodeError)."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Serializa JSON indentado em UTF-8 com orjson quando disponível."""
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: aceita chaves int/float como o json da stdlib
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Acima deste tamanho o arquivo salvo é retirado do page cache após a escrita
+_FADVISE_MIN_BYTES = 1 << 20
+
+
+def write_bytes_atomic(filepath: str, data: bytes, durable: bool = False) -> None:
+    """
+    Escreve bytes direto no descritor, sem a camada de I/O bufferizado.
+    
+    A escrita vai para um arquivo temporário que substitui o destino com
+    os.replace: leitores nunca veem o arquivo truncado ou pela metade.
+    
+    Args:
+        filepath: Arquivo de destino
+        data: Conteúdo a gravar
+        durable: Faz fsync antes da troca (sobrevive a queda de energia).
+            Só então arquivos grandes são descartados do page cache,
+            já que páginas ainda sujas não podem ser liberadas.
+    """
+    tmp_path = filepath + ".tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                # os.write pode escrever parcialmente
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+                if len(data) >= _FADVISE_MIN_BYTES and hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_json_atomic(filepath: str, data: Any, durable: bool = False) -> None:
+    """Serializa (dumps_json) e grava de forma atômica (write_bytes_atomic)."""
+    write_bytes_atomic(filepath, dumps_json(data), durable=durable)
@@ -0,0 +1,45 @@
+"""
+Configuração de Logging
+=======================
+
+Saída dos CLIs do framework via `logging`, configurada uma única vez
+no logger raiz do pacote ("kuber_bomber").
+
+Sem setup_cli_logging o pacote não exibe nada (NullHandler instalado em
+kuber_bomber/__init__.py); quem usa as classes como biblioteca deve
+chamá-la ou configurar o próprio handler para ver o progresso.
+"""
+
+import logging
+import os
+import sys
+
+PACKAGE_LOGGER = "kuber_bomber"
+
+
+def setup_cli_logging(quiet: bool = False) -> logging.Logger:
+    """
+    Configura o logger do pacote para escrever mensagens puras no stdout.
+
+    Chamadas repetidas apenas ajustam o nível; o handler é instalado
+    uma única vez. KUBER_BOMBER_QUIET=1 tem o mesmo efeito de quiet=True
+    (útil em execuções não interativas).
+
+    Args:
+        quiet: Se True, exibe apenas avisos e erros
+
+    Returns:
+        Logger raiz do pacote
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+
+    if not getattr(logger, '_kuber_bomber_configured', False):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.propagate = False
+        logger._kuber_bomber_configured = True
+
+    quiet = quiet or os.environ.get('KUBER_BOMBER_QUIET') == '1'
+    logger.setLevel(logging.WARNING if quiet else logging.INFO)
+    return logger
@@ -13,12 +13,17 @@ import statistics
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 class MTTRAnalyzer:
     """Analisador de tempos de recuperação (MTTR) via testes de confiabilidade."""
     
-    def __init__(self, use_aws: bool = False, aws_config: Optional[Dict] = None, iterations: int = 2):
+    # Limite superior de componentes testados ao mesmo tempo
+    MAX_PARALLELISM = 8
+    
+    def __init__(self, use_aws: bool = False, aws_config: Optional[Dict] = None, iterations: int = 2,
+                 parallelism: int = 1):
         """
         Inicializa o analisador MTTR.
         
@@ -26,10 +31,14 @@ class MTTRAnalyzer:
             use_aws: Se deve usar modo AWS
             aws_config: Configuração AWS
             iterations: Número de iterações por teste (reduzido para 2 para ser mais rápido)
+            parallelism: Componentes testados simultaneamente (1 = em série).
+                EXPERIMENTAL: valores maiores sobrepõem injeções de falha e os
+                MTTR medidos não são comparáveis aos de uma execução em série.
         """
         self.use_aws = use_aws
         self.aws_config = aws_config or {}
         self.iterations = iterations
+        self.parallelism = max(1, min(parallelism, self.MAX_PARALLELISM))
         print(f"📊 MTTR Analyzer inicializado: {iterations} iterações por componente")
         self.iterations = iterations
         self.results: Dict[str, Dict[str, List[float]]] = {
@@ -55,17 +64,29 @@ class MTTRAnalyzer:
         # Extrair componentes do config
         experiment_config = config.get('experiment_config', {})
         
-        # Testar pods/containers
-        if 'applications' in experiment_config:
-            self._test_application_components(experiment_config['applications'])
-        
-        # Testar worker nodes
-        if 'worker_node' in experiment_config:
-            self._test_worker_node_components(experiment_config['worker_node'])
+        # Por padrão os testes rodam em série: cada um é um subprocesso
+        # reliability_tester.py que injeta a falha e aguarda o cluster inteiro
+        # voltar a ficar saudável. Adiantar o próximo componente (ou consultar
+        # seu estado antes) enquanto o atual se recupera contaminaria o MTTR
+        # medido, e o subprocesso já descobre o alvo por conta própria.
+        # O modo paralelo é experimental justamente por isso.
+        if self.parallelism > 1:
+            print(f"⚠️ EXPERIMENTAL: {self.parallelism} componentes testados em paralelo")
+            print("⚠️ Falhas sobrepostas contaminam o MTTR medido; os resultados NÃO são")
+            print("   comparáveis aos de uma análise em série (--mttr-parallelism 1)")
+            self._run_components_parallel(experiment_config)
+        else:
+            # Testar pods/containers
+            if 'applications' in experiment_config:
+                self._test_application_components(experiment_config['applications'])
             
-        # Testar control plane
-        if 'control_plane' in experiment_config:
-            self._test_control_plane_components(experiment_config['control_plane'])
+            # Testar worker nodes
+            if 'worker_node' in experiment_config:
+                self._test_worker_node_components(experiment_config['worker_node'])
+                
+            # Testar control plane
+            if 'control_plane' in experiment_config:
+                self._test_control_plane_components(experiment_config['control_plane'])
         
         # Calcular médias e atualizar config
         mttr_config = self._calculate_mttr_averages()
@@ -73,6 +94,42 @@ class MTTRAnalyzer:
         
         return config
     
+    def _run_components_parallel(self, experiment_config: Dict):
+        """
+        Testa componentes em paralelo com um pool limitado de threads.
+        
+        Experimental: a recuperação de um componente é medida enquanto
+        outros ainda estão sob falha, o que distorce o MTTR.
+        
+        Cada componente (aplicação, worker node ou control plane) é uma
+        unidade de trabalho; as iterações de um mesmo componente continuam
+        sequenciais. Os testes são subprocessos, então o GIL não limita.
+        """
+        units = []
+        for app_name, enabled in experiment_config.get('applications', {}).items():
+            if enabled:
+                units.append((self._test_application, app_name))
+        for node_name, enabled in experiment_config.get('worker_node', {}).items():
+            if enabled:
+                units.append((self._test_worker_node, node_name))
+        for node_name, enabled in experiment_config.get('control_plane', {}).items():
+            if enabled:
+                units.append((self._test_control_plane, node_name))
+        
+        if not units:
+            return
+        
+        workers = min(len(units), self.parallelism)
+        print(f"⚡ Testando {len(units)} componentes com {workers} em paralelo")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(test_fn, name): name for test_fn, name in units}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Erro ao testar {futures[future]}: {e}")
+    
     def _test_application_components(self, applications: Dict[str, bool]):
         """Testa componentes de aplicação (pods/containers)."""
         print("📦 === TESTANDO COMPONENTES DE APLICAÇÃO ===")
@@ -80,13 +137,16 @@ class MTTRAnalyzer:
         for app_name, enabled in applications.items():
             if not enabled:
                 continue
-                
-            print(f"🎯 Testando aplicação: {app_name}")
-            
-            # Testar pod
-            self._test_pod_component(app_name, 'kill_processes')
-            # Testar container
-            self._test_pod_component(app_name, 'kill_init')
+            self._test_application(app_name)
+    
+    def _test_application(self, app_name: str):
+        """Testa pod e container de uma aplicação."""
+        print(f"🎯 Testando aplicação: {app_name}")
+        
+        # Testar pod
+        self._test_pod_component(app_name, 'kill_processes')
+        # Testar container
+        self._test_pod_component(app_name, 'kill_init')
     
     def _test_worker_node_components(self, worker_nodes: Dict[str, bool]):
         """Testa componentes de worker node."""
@@ -95,19 +155,22 @@ class MTTRAnalyzer:
         for node_name, enabled in worker_nodes.items():
             if not enabled:
                 continue
-                
-            print(f"🎯 Testando worker node: {node_name}")
-            
-            # Diferentes tipos de falha para worker nodes
-            test_cases = [
-                ('kill_worker_node_processes', 'worker_node'),
-                ('kill_kubelet', 'wn_kubelet'),
-                ('delete_kube_proxy', 'wn_proxy'),
-                ('restart_containerd', 'wn_runtime')
-            ]
-            
-            for failure_method, component_type in test_cases:
-                self._test_worker_node_component(node_name, failure_method, component_type)
+            self._test_worker_node(node_name)
+    
+    def _test_worker_node(self, node_name: str):
+        """Testa todos os tipos de falha de um worker node."""
+        print(f"🎯 Testando worker node: {node_name}")
+        
+        # Diferentes tipos de falha para worker nodes
+        test_cases = [
+            ('kill_worker_node_processes', 'worker_node'),
+            ('kill_kubelet', 'wn_kubelet'),
+            ('delete_kube_proxy', 'wn_proxy'),
+            ('restart_containerd', 'wn_runtime')
+        ]
+        
+        for failure_method, component_type in test_cases:
+            self._test_worker_node_component(node_name, failure_method, component_type)
     
     def _test_control_plane_components(self, control_planes: Dict[str, bool]):
         """Testa componentes de control plane."""
@@ -116,20 +179,23 @@ class MTTRAnalyzer:
         for node_name, enabled in control_planes.items():
             if not enabled:
                 continue
-                
-            print(f"🎯 Testando control plane: {node_name}")
-            
-            # Diferentes tipos de falha para control plane
-            test_cases = [
-                ('kill_kube_apiserver', 'cp_apiserver'),
-                ('kill_kube_controller_manager', 'cp_manager'),
-                ('kill_kube_scheduler', 'cp_scheduler'),
-                ('kill_etcd', 'cp_etcd')
-            ]
-            
-            for failure_method, component_type in test_cases:
-                timeout = 'extended' if failure_method == 'kill_etcd' else 'normal'
-                self._test_control_plane_component(node_name, failure_method, component_type, timeout)
+            self._test_control_plane(node_name)
+    
+    def _test_control_plane(self, node_name: str):
+        """Testa todos os tipos de falha de um control plane."""
+        print(f"🎯 Testando control plane: {node_name}")
+        
+        # Diferentes tipos de falha para control plane
+        test_cases = [
+            ('kill_kube_apiserver', 'cp_apiserver'),
+            ('kill_kube_controller_manager', 'cp_manager'),
+            ('kill_kube_scheduler', 'cp_scheduler'),
+            ('kill_etcd', 'cp_etcd')
+        ]
+        
+        for failure_method, component_type in test_cases:
+            timeout = 'extended' if failure_method == 'kill_etcd' else 'normal'
+            self._test_control_plane_component(node_name, failure_method, component_type, timeout)
     
     def _test_pod_component(self, target: str, failure_method: str):
         """Executa teste em componente de pod."""
@@ -154,7 +220,7 @@ class MTTRAnalyzer:
         
         # Calcular e salvar média se houver dados
         if recovery_times:
-            avg_time = statistics.mean(recovery_times)
+            avg_time = statistics.fmean(recovery_times)
             print(f"  📊 Média para {target}: {avg_time:.1f}s ({len(recovery_times)}/{self.iterations} sucessos)")
             
             # Atualizar configuração de MTTR
@@ -194,7 +260,7 @@ class MTTRAnalyzer:
         
         # Calcular e salvar média se houver dados
         if recovery_times:
-            avg_time = statistics.mean(recovery_times)
+            avg_time = statistics.fmean(recovery_times)
             print(f"  � Média para {node_name} ({component_type}): {avg_time:.1f}s ({len(recovery_times)}/{self.iterations} sucessos)")
             
             # Atualizar configuração de MTTR
@@ -235,7 +301,7 @@ class MTTRAnalyzer:
         
         # Calcular e salvar média se houver dados
         if recovery_times:
-            avg_time = statistics.mean(recovery_times)
+            avg_time = statistics.fmean(recovery_times)
             print(f"  � Média para {node_name} ({component_type}): {avg_time:.1f}s ({len(recovery_times)}/{self.iterations} sucessos)")
             
             # Atualizar configuração de MTTR
@@ -386,7 +452,7 @@ class MTTRAnalyzer:
             
             for component, times in components.items():
                 if times:
-                    avg_time = statistics.mean(times)
+                    avg_time = statistics.fmean(times)
                     mttr_config[category][component] = round(avg_time, 1)
                     
                     print(f"  {component}: {avg_time:.1f}s (média de {len(times)} medições)")